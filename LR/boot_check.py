@@ -0,0 +1,55 @@
+# Boot check for the firmware off the Pico: installs the shims,
+# imports lrv (as .mpy from the build when run by `build.py --check`),
+# reports how long the import took and how much RAM it left free, then
+# runs one reading through the color, LRV and display code.
+# Runs on the unix port of MicroPython and, without the RAM figures, CPython.
+import gc
+import sys
+import time
+
+import shims
+
+shims.install()
+from time import ticks_us, ticks_diff
+
+try:
+    mem_free = gc.mem_free
+except AttributeError:
+    mem_free = None
+
+
+def main():
+    gc.collect()
+    free_before = mem_free() if mem_free else 0
+    start = ticks_us()
+    import lrv
+    import_us = ticks_diff(ticks_us(), start)
+    gc.collect()
+    free_after = mem_free() if mem_free else 0
+
+    print("lrv imported from {} in {} ms".format(
+        getattr(lrv, '__file__', '(frozen)'), import_us / 1000))
+    print("palette tables: {}".format(
+        "prebuilt" if 'palette_data' in sys.modules else "built at import"))
+    if mem_free:
+        print("RAM: {} bytes free, {} used by the import".format(free_after, free_before - free_after))
+
+    lut = lrv.build_color_lut()
+    print("color LUT: {} bytes, {}".format(
+        len(lut), "prebuilt" if 'palette_lut' in sys.modules else "built at startup"))
+
+    assert lrv.find_nearest_color(0x40, 0xE0, 0xD0) == "Turquoise"
+    lrv.color_lut = lut
+    lrv.last_color[0] = -1
+    assert lrv.find_nearest_color(0x40, 0xE0, 0xD0) == "Turquoise"
+    lrv.color_lut = None
+    assert lrv.calculate_lrv_tenths(0, 0, 0, 0) == 0
+    assert lrv.calculate_lrv_tenths(100, 100, 100, 100) == 1000
+    lrv.i2c_display.reset()
+    lrv.display_readings((0x40, 0xE0, 0xD0, 0), "Turquoise", 456)
+    print("display: {} I2C transactions, {} bytes for one frame".format(
+        lrv.i2c_display.transactions, lrv.i2c_display.bytes_written))
+    print("boot check passed")
+
+
+main()
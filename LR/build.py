@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""
+Build the firmware for a faster Pico boot.
+
+Generates the palette tables (and the color lookup table) as modules of
+plain bytes constants, compiles them and the firmware modules to .mpy
+bytecode with mpy-cross, and writes a manifest for freezing the same
+modules into a MicroPython image:
+
+    python LR/build.py            # LR/build/pico/: copy its files to the Pico
+    python LR/build.py --check    # ...and boot check them on the unix port
+
+With .mpy files the Pico skips compiling the sources at every boot, and
+the tables no longer get built from colors.py at import. MicroPython
+imports a .py ahead of a .mpy of the same name, and ahead of a frozen
+module, so delete the source copies of the modules from the Pico when
+installing the build (build.py prints the mpremote command). Frozen into
+the firmware image (see LR/build/manifest.py) the modules aren't loaded
+into RAM at all: their bytecode and bytes constants are used straight
+from flash. mpy-cross must match the MicroPython version on the Pico
+(pip install mpy-cross==<version>).
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+LR_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_DIR = os.path.join(LR_DIR, 'build')
+
+# Modules the firmware imports, compiled in this order
+MODULES = ('lrv', 'ringbuffer', 'profiler', 'palette', 'ssd1306')
+# Modules generated into build/gen
+GENERATED = ('palette_data', 'palette_lut')
+# Copied as source: MicroPython only runs main.py from the filesystem
+SOURCES = ('main.py',)
+
+# Base manifest of the board's firmware, included by the generated manifest
+BASE_MANIFEST = "$(PORT_DIR)/boards/manifest.py"
+
+
+def generate_tables(gen_dir):
+    """Write palette_data.py and palette_lut.py with the tables as bytes constants"""
+    sys.path.insert(0, LR_DIR)
+    try:
+        from colors import HTML_COLORS
+        from palette import pack_palette, build_lut
+    finally:
+        sys.path.remove(LR_DIR)
+
+    names, table = pack_palette(HTML_COLORS)
+    with open(os.path.join(gen_dir, 'palette_data.py'), 'w') as f:
+        f.write("# Generated by build.py from colors.py, do not edit\n")
+        f.write("PALETTE_NAMES = (\n")
+        for name in names:
+            f.write(f"    {name!r},\n")
+        f.write(")\n")
+        f.write(f"PALETTE_RGB = {table!r}\n")
+
+    with open(os.path.join(gen_dir, 'palette_lut.py'), 'w') as f:
+        f.write("# Generated by build.py from colors.py, do not edit\n")
+        f.write(f"COLOR_LUT = {bytes(build_lut(table))!r}\n")
+    print(f"Generated {len(names)} palette colors and a {16 ** 3} byte color LUT")
+
+
+def compile_module(mpy_cross, source, output):
+    subprocess.run([mpy_cross, '-o', output, '-s', os.path.basename(source), source], check=True)
+
+
+def write_manifest(path, gen_dir, base_manifest):
+    with open(path, 'w') as f:
+        f.write("# Generated by build.py. Freeze the firmware into a MicroPython image with\n")
+        f.write("#   make -C ports/rp2 BOARD=<board> FROZEN_MANIFEST=" + path + "\n")
+        if base_manifest:
+            f.write(f"include({base_manifest!r})\n")
+        for name in MODULES:
+            f.write(f"module({name + '.py'!r}, base_path={LR_DIR!r})\n")
+        for name in GENERATED:
+            f.write(f"module({name + '.py'!r}, base_path={gen_dir!r})\n")
+
+
+def build(out, mpy_cross, base_manifest=BASE_MANIFEST):
+    gen_dir = os.path.join(out, 'gen')
+    pico_dir = os.path.join(out, 'pico')
+    os.makedirs(gen_dir, exist_ok=True)
+    os.makedirs(pico_dir, exist_ok=True)
+
+    generate_tables(gen_dir)
+    sources = [os.path.join(LR_DIR, name + '.py') for name in MODULES]
+    sources += [os.path.join(gen_dir, name + '.py') for name in GENERATED]
+    for source in sources:
+        name = os.path.splitext(os.path.basename(source))[0]
+        output = os.path.join(pico_dir, name + '.mpy')
+        compile_module(mpy_cross, source, output)
+        print(f"{name + '.mpy':20s} {os.path.getsize(output):7d} bytes")
+    for name in SOURCES:
+        shutil.copy(os.path.join(LR_DIR, name), pico_dir)
+
+    manifest = os.path.join(out, 'manifest.py')
+    write_manifest(manifest, gen_dir, base_manifest)
+    print(f"Pico files in {pico_dir}, frozen manifest {manifest}")
+    # Source copies on the Pico would be imported instead of the build
+    stale = ' '.join(':' + name + '.py' for name in MODULES)
+    print("Remove the module sources from the Pico, or it keeps running them:")
+    print(f"    mpremote rm {stale}")
+    return pico_dir, gen_dir
+
+
+def check(interpreter, pico_dir, gen_dir):
+    """Run boot_check.py against the build; True if it passed"""
+    # .mpy files come first, so the compiled modules are the ones imported.
+    # CPython can't load them and falls back to the sources.
+    path = os.pathsep.join((pico_dir, gen_dir, LR_DIR))
+    env = dict(os.environ, MICROPYPATH=path, PYTHONPATH=path)
+    print(f"Boot check with {interpreter}:")
+    return subprocess.run([interpreter, '-m', 'boot_check'], cwd=pico_dir, env=env).returncode == 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build the Pico firmware modules as .mpy bytecode')
+    parser.add_argument('--out', default=BUILD_DIR,
+                        help=f'Build directory (default {BUILD_DIR})')
+    parser.add_argument('--mpy-cross', default='mpy-cross',
+                        help='mpy-cross executable (default: from PATH)')
+    parser.add_argument('--base-manifest', default=BASE_MANIFEST,
+                        help=f'Board manifest the frozen manifest includes (default {BASE_MANIFEST})')
+    parser.add_argument('--check', action='store_true',
+                        help='Boot check the build on the unix port of MicroPython')
+    parser.add_argument('--micropython', default='micropython',
+                        help='Interpreter for --check (default: micropython from PATH)')
+    args = parser.parse_args()
+    if shutil.which(args.mpy_cross) is None:
+        parser.error(f"{args.mpy_cross} not found (pip install mpy-cross)")
+    if args.check and shutil.which(args.micropython) is None:
+        parser.error(f"{args.micropython} not found (build ports/unix of MicroPython)")
+    return args
+
+
+def main():
+    args = parse_args()
+    out = os.path.abspath(args.out)
+    pico_dir, gen_dir = build(out, args.mpy_cross, args.base_manifest)
+    if args.check and not check(args.micropython, pico_dir, gen_dir):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
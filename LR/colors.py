@@ -0,0 +1,59 @@
+# Named colors find_nearest_color() chooses from; build.py packs them into
+# palette_data.py for the firmware image
+HTML_COLORS = [
+
+    {"name": "Beige", "code": "#F5F5DC"},
+    {"name": "Black", "code": "#000000"},
+
+    {"name": "Blue", "code": "#0000FF"},
+
+    {"name": "Brown", "code": "#A52A2A"},
+    {"name": "Coral", "code": "#FF7F50"},
+    {"name": "Crimson", "code": "#DC143C"},
+    {"name": "Cyan", "code": "#00FFFF"},
+    {"name": "DarkBlue", "code": "#00008B"},
+    {"name": "DarkCyan", "code": "#008B8B"},
+    {"name": "DarkGray", "code": "#A9A9A9"},
+    {"name": "DarkGreen", "code": "#006400"},
+    {"name": "DarkKhaki", "code": "#BDB76B"},
+    {"name": "DarkMagenta", "code": "#8B008B"},
+    {"name": "DarkOliveGreen", "code": "#556B2F"},
+    {"name": "DarkOrange", "code": "#FF8C00"},
+    {"name": "DarkRed", "code": "#8B0000"},
+    {"name": "DarkViolet", "code": "#9400D3"},
+    {"name": "Fuchsia", "code": "#FF00FF"},
+    {"name": "Gold", "code": "#FFD700"},
+    {"name": "Gray", "code": "#808080"},
+    {"name": "Green", "code": "#008000"},
+    {"name": "Indigo", "code": "#4B0082"},
+    {"name": "Ivory", "code": "#FFFFF0"},
+    {"name": "Khaki", "code": "#F0E68C"},
+    {"name": "Lavender", "code": "#E6E6FA"},
+    {"name": "LightBlue", "code": "#ADD8E6"},
+    {"name": "LightCoral", "code": "#F08080"},
+    {"name": "LightCyan", "code": "#E0FFFF"},
+    {"name": "LightGray", "code": "#D3D3D3"},
+    {"name": "LightGreen", "code": "#90EE90"},
+    {"name": "LightSkyBlue", "code": "#87CEFA"},
+    {"name": "LightYellow", "code": "#FFFFE0"},
+    {"name": "Lime", "code": "#00FF00"},
+    {"name": "Magenta", "code": "#FF00FF"},
+    {"name": "Navy", "code": "#000080"},
+    {"name": "Olive", "code": "#808000"},
+    {"name": "Orange", "code": "#FFA500"},
+    {"name": "Orchid", "code": "#DA70D6"},
+    {"name": "Pink", "code": "#FFC0CB"},
+    {"name": "Purple", "code": "#800080"},
+    {"name": "Red", "code": "#FF0000"},
+    {"name": "RoyalBlue", "code": "#4169E1"},
+    {"name": "Salmon", "code": "#FA8072"},
+    {"name": "Sienna", "code": "#A0522D"},
+    {"name": "Silver", "code": "#C0C0C0"},
+    {"name": "SlateGray", "code": "#708090"},
+    {"name": "Turquoise", "code": "#40E0D0"},
+    {"name": "Violet", "code": "#EE82EE"},
+
+    {"name": "White", "code": "#FFFFFF"},
+
+    {"name": "Yellow", "code": "#FFFF00"},
+]
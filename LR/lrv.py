@@ -2,8 +2,10 @@ from breakout_bh1745 import BreakoutBH1745
 from pimoroni_i2c import PimoroniI2C
 from machine import Pin, I2C
 import time
-import math
 from ssd1306 import SSD1306_I2C
+from ringbuffer import SampleRing, MEDIAN
+from profiler import Profiler
+from palette import pack_palette, nearest_index, build_lut
 
 VERSION = "1.2.5"
 print(f"LRV Sensor Script v{VERSION}")
@@ -19,112 +21,179 @@ SENSITIVITY_CORRECTIONS = {
     'blue': 0.55   # Peak around 465nm with ~0.55 relative sensitivity
 }
 
-HTML_COLORS = [
-
-    {"name": "Beige", "code": "#F5F5DC"},
-    {"name": "Black", "code": "#000000"},
-
-    {"name": "Blue", "code": "#0000FF"},
-
-    {"name": "Brown", "code": "#A52A2A"},
-    {"name": "Coral", "code": "#FF7F50"},
-    {"name": "Crimson", "code": "#DC143C"},
-    {"name": "Cyan", "code": "#00FFFF"},
-    {"name": "DarkBlue", "code": "#00008B"},
-    {"name": "DarkCyan", "code": "#008B8B"},
-    {"name": "DarkGray", "code": "#A9A9A9"},
-    {"name": "DarkGreen", "code": "#006400"},
-    {"name": "DarkKhaki", "code": "#BDB76B"},
-    {"name": "DarkMagenta", "code": "#8B008B"},
-    {"name": "DarkOliveGreen", "code": "#556B2F"},
-    {"name": "DarkOrange", "code": "#FF8C00"},
-    {"name": "DarkRed", "code": "#8B0000"},
-    {"name": "DarkViolet", "code": "#9400D3"},
-    {"name": "Fuchsia", "code": "#FF00FF"},
-    {"name": "Gold", "code": "#FFD700"},
-    {"name": "Gray", "code": "#808080"},
-    {"name": "Green", "code": "#008000"},
-    {"name": "Indigo", "code": "#4B0082"},
-    {"name": "Ivory", "code": "#FFFFF0"},
-    {"name": "Khaki", "code": "#F0E68C"},
-    {"name": "Lavender", "code": "#E6E6FA"},
-    {"name": "LightBlue", "code": "#ADD8E6"},
-    {"name": "LightCoral", "code": "#F08080"},
-    {"name": "LightCyan", "code": "#E0FFFF"},
-    {"name": "LightGray", "code": "#D3D3D3"},
-    {"name": "LightGreen", "code": "#90EE90"},
-    {"name": "LightSkyBlue", "code": "#87CEFA"},
-    {"name": "LightYellow", "code": "#FFFFE0"},
-    {"name": "Lime", "code": "#00FF00"},
-    {"name": "Magenta", "code": "#FF00FF"},
-    {"name": "Navy", "code": "#000080"},
-    {"name": "Olive", "code": "#808000"},
-    {"name": "Orange", "code": "#FFA500"},
-    {"name": "Orchid", "code": "#DA70D6"},
-    {"name": "Pink", "code": "#FFC0CB"},
-    {"name": "Purple", "code": "#800080"},
-    {"name": "Red", "code": "#FF0000"},
-    {"name": "RoyalBlue", "code": "#4169E1"},
-    {"name": "Salmon", "code": "#FA8072"},
-    {"name": "Sienna", "code": "#A0522D"},
-    {"name": "Silver", "code": "#C0C0C0"},
-    {"name": "SlateGray", "code": "#708090"},
-    {"name": "Turquoise", "code": "#40E0D0"},
-    {"name": "Violet", "code": "#EE82EE"},
-
-    {"name": "White", "code": "#FFFFFF"},
-
-    {"name": "Yellow", "code": "#FFFF00"},
-]
+# CIE luminance weights divided by the sensitivity corrections, as exact
+# fractions for calculate_lrv_tenths(): 0.2126 / 0.7 = 58465 / 192500,
+# 0.7152 / 1.0 = 137676 / 192500 and 0.0722 / 0.55 = 25270 / 192500
+LRV_WEIGHT_R = 58465
+LRV_WEIGHT_G = 137676
+LRV_WEIGHT_B = 25270
+LRV_WEIGHT_DEN = 192500
+LRV_WEIGHT_R_HIGH = LRV_WEIGHT_R >> 9
+LRV_WEIGHT_G_HIGH = LRV_WEIGHT_G >> 9
+LRV_WEIGHT_B_HIGH = LRV_WEIGHT_B >> 9
+LRV_WEIGHT_R_LOW = LRV_WEIGHT_R & 511
+LRV_WEIGHT_G_LOW = LRV_WEIGHT_G & 511
+LRV_WEIGHT_B_LOW = LRV_WEIGHT_B & 511
+# Channel to clear ratios at which one channel alone makes 100% LRV
+LRV_LIMIT_R = -(-LRV_WEIGHT_DEN // LRV_WEIGHT_R)
+LRV_LIMIT_G = -(-LRV_WEIGHT_DEN // LRV_WEIGHT_G)
+LRV_LIMIT_B = -(-LRV_WEIGHT_DEN // LRV_WEIGHT_B)
+
+# Samples per second. The BH1745 needs at least 160 ms per measurement
+# (320 ms as set up by default), which caps the rate at 6.25 per second.
+SAMPLE_RATE = 1
+MEASUREMENT_TIMES_MS = (160, 320)
+
+# Filter each reading over this many of the latest samples (1 = no filtering)
+OVERSAMPLE = 1
+FILTER = MEDIAN
+
+# Time each section of the main loop and print a summary every PROFILE_EVERY
+# loops and on Ctrl-C; lrv.profiler.report() prints one from the REPL.
+PROFILE = False
+PROFILE_EVERY = 60
+PROFILE_SECTIONS = ("read", "color", "render", "show", "print")
+READ, COLOR, RENDER, SHOW, PRINT = range(len(PROFILE_SECTIONS))
+profiler = Profiler(PROFILE_SECTIONS, report_every=PROFILE_EVERY, enabled=PROFILE)
+
+def calculate_lrv_tenths(r, g, b, c):
+    """
+    LRV in tenths of a percent (0-1000), in integer arithmetic only.
+
+    Same result as rounding the float formula to 0.1, but every
+    intermediate value stays below 2**30, so on the Pico nothing is
+    allocated: the luminance is an exact fraction with LRV_WEIGHT_*
+    over LRV_WEIGHT_DEN * c, divided in parts.
+    """
+    if c == 0:
+        return 0
+
+    # Whole part of each channel's ratio to the clear channel; past the
+    # limits the luminance is 100% whatever the other channels are
+    ar = r // c
+    ag = g // c
+    ab = b // c
+    if ar >= LRV_LIMIT_R or ag >= LRV_LIMIT_G or ab >= LRV_LIMIT_B:
+        return 1000
+    r -= ar * c
+    g -= ag * c
+    b -= ab * c
+
+    # Weighted sum of the remainders, with the weights split at bit 9 to
+    # keep the products small, divided by c into quotient and remainder
+    high = LRV_WEIGHT_R_HIGH * r + LRV_WEIGHT_G_HIGH * g + LRV_WEIGHT_B_HIGH * b
+    low = LRV_WEIGHT_R_LOW * r + LRV_WEIGHT_G_LOW * g + LRV_WEIGHT_B_LOW * b
+    q_high = high // c
+    low += (high - q_high * c) << 9
+    q_low = low // c
+    remainder = low - q_low * c
+    weighted = LRV_WEIGHT_R * ar + LRV_WEIGHT_G * ag + LRV_WEIGHT_B * ab + (q_high << 9) + q_low
+    if weighted >= LRV_WEIGHT_DEN:
+        return 1000
+
+    # Round half up: tenths = (weighted + remainder / c) * 1000 / LRV_WEIGHT_DEN,
+    # where 1000 / LRV_WEIGHT_DEN = 2 / 385
+    numerator = 4 * weighted + 385
+    tenths = numerator // 770
+    rest = 770 - (numerator - tenths * 770)
+    if rest <= 3 and 4 * remainder >= rest * c:
+        tenths += 1
+    return tenths
 
 def calculate_lrv(r, g, b, c):
     """Calculate calibrated Light Reflectance Value (LRV)"""
+    return calculate_lrv_tenths(r, g, b, c) / 10
+
+def format_tenths(tenths):
+    """Format a value in tenths as a decimal, e.g. 456 as 45.6"""
+    return "{}.{}".format(tenths // 10, tenths % 10)
+
+def rgbc_clamped(rgbc):
+    """RGB scaled so the brightest channel is 255, computed from one raw reading"""
+    r, g, b, c = rgbc
+    vmax = max(r, g, b)
+    if vmax == 0:
+        return (0, 0, 0, c)
+    return (r * 255 // vmax, g * 255 // vmax, b * 255 // vmax, c)
+
+def rgbc_scaled(rgbc):
+    """RGB relative to the clear channel (0-255), computed from one raw reading"""
+    r, g, b, c = rgbc
     if c == 0:
-        return 0
-        
-    # Apply sensitivity corrections to raw values
-    r_corrected = r / SENSITIVITY_CORRECTIONS['red']
-    g_corrected = g / SENSITIVITY_CORRECTIONS['green']
-    b_corrected = b / SENSITIVITY_CORRECTIONS['blue']
-    
-    # Normalize using clear reading
-    r_norm = r_corrected / c
-    g_norm = g_corrected / c
-    b_norm = b_corrected / c
-    
-    # Calculate relative luminance using CIE coefficients
-    luminance = (0.2126 * r_norm) + (0.7152 * g_norm) + (0.0722 * b_norm)
-    
-    # Scale to 0-100 range
-    lrv = min(100, luminance * 100)
-    return round(lrv, 1)
+        return (0, 0, 0, c)
+    return (min(255, r * 255 // c), min(255, g * 255 // c), min(255, b * 255 // c), c)
 
-def hex_to_rgb(hex_color):
-    """Convert hex color (#RRGGBB) to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+try:
+    # Tables generated by build.py: frozen into the firmware they stay in flash
+    from palette_data import PALETTE_NAMES, PALETTE_RGB
+except ImportError:
+    from colors import HTML_COLORS
+    PALETTE_NAMES, PALETTE_RGB = pack_palette(HTML_COLORS)
 
-def color_distance(r1, g1, b1, r2, g2, b2):
-    """Calculate Euclidean distance between two RGB colors"""
-    return math.sqrt((r1-r2)**2 + (g1-g2)**2 + (b1-b2)**2)
+# Set to True to name colors through a 16x16x16 lookup table (4 kB of RAM,
+# built once at startup) instead of searching the palette for every sample
+USE_COLOR_LUT = False
+color_lut = None
 
-def find_nearest_color(r, g, b, c):
+# Last color looked up and its name, reused while the sample doesn't change
+last_color = [-1, -1, -1, None]
+
+def build_color_lut():
+    """The lookup table for USE_COLOR_LUT: prebuilt by build.py if available, else computed now"""
+    try:
+        from palette_lut import COLOR_LUT
+        return COLOR_LUT
+    except ImportError:
+        return build_lut(PALETTE_RGB)
+
+def find_nearest_color(r, g, b, c=0):
     """Find the nearest HTML color name for given RGB values"""
-    min_distance = float('inf')
-    nearest_color = None
-    
-    for color in HTML_COLORS:
-        rgb = hex_to_rgb(color['code'])
-        distance = color_distance(r, g, b, *rgb)
-        
-        if distance < min_distance:
-            min_distance = distance
-            nearest_color = color['name']
-    
-    return nearest_color
+    last = last_color
+    if r == last[0] and g == last[1] and b == last[2]:
+        return last[3]
 
-def display_readings(rgb_scaled, color_name, lrv):
-    """Display readings on the OLED"""
+    if color_lut is not None:
+        index = color_lut[(min(r, 255) >> 4) << 8 | (min(g, 255) >> 4) << 4 | (min(b, 255) >> 4)]
+    else:
+        index = nearest_index(PALETTE_RGB, r, g, b)
+
+    name = PALETTE_NAMES[index]
+    last[0] = r
+    last[1] = g
+    last[2] = b
+    last[3] = name
+    return name
+
+class Ticker:
+    """Fixed-rate loop timing from time.ticks_ms() deadlines, so the period doesn't drift"""
+    def __init__(self, rate):
+        self.period_ms = int(1000 / rate)
+        if self.period_ms < MEASUREMENT_TIMES_MS[0]:
+            raise ValueError("rate is above the sensor's maximum of 6.25 samples per second")
+        self.deadline = time.ticks_add(time.ticks_ms(), self.period_ms)
+        self.ticks = 0
+        self.overruns = 0
+        self.jitter_ms = 0
+        self.jitter_max_ms = 0
+
+    def wait(self):
+        """Sleep until the next deadline, skipping any periods the loop overran"""
+        now = time.ticks_ms()
+        late = time.ticks_diff(now, self.deadline)
+        if late > 0:
+            missed = late // self.period_ms + 1
+            self.overruns += missed
+            self.deadline = time.ticks_add(self.deadline, missed * self.period_ms)
+        time.sleep_ms(time.ticks_diff(self.deadline, now))
+
+        self.jitter_ms = time.ticks_diff(time.ticks_ms(), self.deadline)
+        if self.jitter_ms > self.jitter_max_ms:
+            self.jitter_max_ms = self.jitter_ms
+        self.ticks += 1
+        self.deadline = time.ticks_add(self.deadline, self.period_ms)
+
+def draw_readings(rgb_scaled, color_name, lrv_tenths):
+    """Draw readings into the OLED's frame buffer"""
     oled.fill(0)  # Clear display
     
     # First line: RGB as hex
@@ -137,15 +206,25 @@ def display_readings(rgb_scaled, color_name, lrv):
     oled.text(color_name, 0, 12)
     
     # Third line: LRV value
-    oled.text(f"LRV: {lrv:.1f}%", 0, 24)
-    
-    # Update display
+    oled.text("LRV: {}%".format(format_tenths(lrv_tenths)), 0, 24)
+
+def display_readings(rgb_scaled, color_name, lrv_tenths):
+    """Display readings on the OLED"""
+    draw_readings(rgb_scaled, color_name, lrv_tenths)
     oled.show()
-    # pass
-def main():
+
+def main(rate=SAMPLE_RATE):
+    global color_lut
+    if USE_COLOR_LUT:
+        color_lut = build_color_lut()
+
     # Initialize I2C for color sensor
     i2c = PimoroniI2C(sda=0, scl=1)
     sensor = BreakoutBH1745(i2c)
+    ring = SampleRing(OVERSAMPLE)
+    ticker = Ticker(rate)
+    if ticker.period_ms < MEASUREMENT_TIMES_MS[1]:
+        sensor.measurement_time_ms(MEASUREMENT_TIMES_MS[0])
     
     # Turn on LEDs
     sensor.leds(True)
@@ -153,20 +232,31 @@ def main():
     
     try:
         while True:
-            # Get all readings
+            profiler.begin()
+            # One bus transaction per sample; the other views are derived from it
             rgbc_raw = sensor.rgbc_raw()
-            rgb_clamped = sensor.rgbc_clamped()
-            rgb_scaled = sensor.rgbc_scaled()
+            if OVERSAMPLE > 1:
+                ring.push(*rgbc_raw)
+                rgbc = ring.filtered(FILTER)
+            else:
+                rgbc = rgbc_raw
+            rgb_clamped = rgbc_clamped(rgbc)
+            rgb_scaled = rgbc_scaled(rgbc)
             
             # Calculate LRV using raw values
-            r, g, b, c = rgbc_raw
-            lrv = calculate_lrv(r, g, b, c)
+            r, g, b, c = rgbc
+            lrv_tenths = calculate_lrv_tenths(r, g, b, c)
+            profiler.lap(READ)
             
             # Find nearest HTML color using rgb_scaled directly
             color_name = find_nearest_color(*rgb_scaled)
+            profiler.lap(COLOR)
             
             # Update OLED display
-            display_readings(rgb_scaled, color_name, lrv)
+            draw_readings(rgb_scaled, color_name, lrv_tenths)
+            profiler.lap(RENDER)
+            oled.show()
+            profiler.lap(SHOW)
             current_time = time.localtime()
             print(f"Time: {current_time[3]:02d}:{current_time[4]:02d}:{current_time[5]:02d}")
             # Print all values to console too
@@ -174,10 +264,13 @@ def main():
             print("Clamped: {}, {}, {}, {}".format(*rgb_clamped))
             print("Scaled: #{:02x}{:02x}{:02x}".format(*rgb_scaled))
             print(f"Nearest Color: {color_name}")
-            print(f"LRV: {lrv:.1f}%")
+            print("LRV: {}%".format(format_tenths(lrv_tenths)))
+            print(f"Timing: {ticker.overruns} overruns, jitter {ticker.jitter_ms} ms (max {ticker.jitter_max_ms} ms)")
             print("---")
+            profiler.lap(PRINT)
+            profiler.end()
             
-            time.sleep(1)
+            ticker.wait()
             
     except KeyboardInterrupt:
         sensor.leds(False)
@@ -185,6 +278,8 @@ def main():
         # oled.text("Stopped", 0, 12)
         # oled.show()
         print("\nLEDs turned off")
+        if profiler.enabled:
+            profiler.report()
         print("Program terminated.")
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
 # Simple main.py to run our LRV script
+import gc
+import time
 print("Starting LRV measurement...")
 import lrv
+gc.collect()
+print("Boot: {} ms, {} bytes free".format(time.ticks_ms(), gc.mem_free()))
 lrv.main()
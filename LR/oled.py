@@ -2,90 +2,108 @@ from machine import Pin, I2C
 import framebuf
 import time
 
+# I2C control bytes: Co=0 (no further control bytes), D/C# selects command or data
+CONTROL_CMD = b'\x00'
+CONTROL_DATA = b'\x40'
+
+# Init sequence from the display's working example, sent as one command stream
+INIT_SEQUENCE = bytes((
+    0xAE,  # display off
+
+    0x00,  # set lower column address
+    0x12,  # set higher column address
+
+    0x00,  # set display start line
+
+    0xB0,  # set page address
+
+    0x81,  # contract control
+    0x4f,  # 128
+
+    0xA1,  # set segment remap
+
+    0xA6,  # normal / reverse
+
+    0xA8,  # multiplex ratio
+    0x1F,  # duty = 1/32
+
+    0xC8,  # Com scan direction
+
+    0xD3,  # set display offset
+    0x00,
+
+    0x20,  # Set Memory Addressing Mode
+    0x01,  # set Vertical Addressing Mode
+
+    0xD5,  # set osc division
+    0x80,
+
+    0xD9,  # set pre-charge period
+    0xf1,
+
+    0xDA,  # set COM pins
+    0x12,
+
+    0xdb,  # set vcomh
+    0x40,
+
+    0x8d,  # set charge pump enable
+    0x14,
+
+    0xAF,  # display ON
+))
+
 class OLED_Display(framebuf.FrameBuffer):
     def __init__(self, i2c_num=0, i2c_scl=1, i2c_sda=0, i2c_freq=300000):
         print(f"Initializing OLED Display with i2c_num={i2c_num}, i2c_scl={i2c_scl}, i2c_sda={i2c_sda}, i2c_freq={i2c_freq}")
         self.width = 64
         self.height = 32
-        
+
         self.olde_addr = 0x3c
         self.i2c = I2C(id=i2c_num, scl=Pin(i2c_scl), sda=Pin(i2c_sda), freq=i2c_freq)
-        
+
         self.temp = bytearray(2)
         self.buffer = bytearray(self.width * self.height//8)
-        
+
+        # Preallocated transfers for show(): the page/column window command
+        # stream and a view of the buffer for each page
+        pages = self.height // 8
+        view = memoryview(self.buffer)
+        self.page_cmds = [bytes((
+            0x22, i, i,    # set start and end page address
+            0x21, 0x20, 0x5f  # set low and high column address
+        )) for i in range(pages)]
+        self.page_data = [view[self.width * i:self.width * (i + 1)] for i in range(pages)]
+        self.cmd_list = [CONTROL_CMD, None]
+        self.data_list = [CONTROL_DATA, None]
+
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
-        
+
         self.white = 0xffff
         self.black = 0x0000
-        
+
     def write_cmd(self, cmd):
         self.temp[0] = 0x00
         self.temp[1] = cmd
         self.i2c.writeto(self.olde_addr, self.temp)
 
+    def write_cmds(self, cmds):
+        """Send a sequence of command bytes in one I2C transaction"""
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.olde_addr, self.cmd_list)
+
     def write_data(self, buf):
-        self.temp[0] = 0x40
-        self.temp[1] = buf
-        self.i2c.writeto(self.olde_addr, self.temp)
+        """Send display data bytes in one I2C transaction"""
+        self.data_list[1] = buf
+        self.i2c.writevto(self.olde_addr, self.data_list)
 
     def init_display(self):
         """Initialize display using their working sequence"""
-        self.write_cmd(0xAE)  # display off
-        
-        self.write_cmd(0x00)  # set lower column address
-        self.write_cmd(0x12)  # set higher column address
-        
-        self.write_cmd(0x00)  # set display start line
-        
-        self.write_cmd(0xB0)  # set page address
-        
-        self.write_cmd(0x81)  # contract control
-        self.write_cmd(0x4f)  # 128
-        
-        self.write_cmd(0xA1)  # set segment remap
-        
-        self.write_cmd(0xA6)  # normal / reverse
-        
-        self.write_cmd(0xA8)  # multiplex ratio
-        self.write_cmd(0x1F)  # duty = 1/32
-        
-        self.write_cmd(0xC8)  # Com scan direction
-        
-        self.write_cmd(0xD3)  # set display offset
-        self.write_cmd(0x00)
-        
-        self.write_cmd(0x20)  # Set Memory Addressing Mode
-        self.write_cmd(0x01)  # set Vertical Addressing Mode
-        
-        self.write_cmd(0xD5)  # set osc division
-        self.write_cmd(0x80)
-        
-        self.write_cmd(0xD9)  # set pre-charge period
-        self.write_cmd(0xf1)
-        
-        self.write_cmd(0xDA)  # set COM pins
-        self.write_cmd(0x12)
-        
-        self.write_cmd(0xdb)  # set vcomh
-        self.write_cmd(0x40)
-        
-        self.write_cmd(0x8d)  # set charge pump enable
-        self.write_cmd(0x14)
-        
-        self.write_cmd(0xAF)  # display ON
+        self.write_cmds(INIT_SEQUENCE)
 
     def show(self):
-        """Update display using their working method"""
-        for i in range(0, 4):
-            self.write_cmd(0x22)
-            self.write_cmd(0x00+i)  # set start page address
-            self.write_cmd(0x00+i)  # set end page address
-            self.write_cmd(0x21)
-            self.write_cmd(0x20)  # set low column address
-            self.write_cmd(0x5f)  # set high column address
-            
-            # write data
-            for j in range(0, self.width):
-                self.write_data(self.buffer[j+self.width*i]) 
\ No newline at end of file
+        """Update display one page per transfer: the page's window, then its data"""
+        for i in range(len(self.page_cmds)):
+            self.write_cmds(self.page_cmds[i])
+            self.write_data(self.page_data[i])
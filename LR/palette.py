@@ -0,0 +1,47 @@
+# Color palette tables and nearest-color search. Shared by the firmware and
+# by build.py, which runs the same code under CPython to generate the tables
+# ahead of time.
+
+def hex_to_rgb(hex_color):
+    """Convert hex color (#RRGGBB) to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+def pack_palette(colors):
+    """Pack the palette into a tuple of names and a bytes table of r, g, b triples"""
+    names = []
+    table = bytearray(3 * len(colors))
+    for i, color in enumerate(colors):
+        names.append(color['name'])
+        table[3*i], table[3*i+1], table[3*i+2] = hex_to_rgb(color['code'])
+    return tuple(names), bytes(table)
+
+def nearest_index(table, r, g, b):
+    """Index of the entry of a packed table closest to r, g, b (integer squared distance)"""
+    best_index = 0
+    best_distance = 3 * 256 * 256
+    i = 0
+    index = 0
+    end = len(table)
+    while i < end:
+        dr = r - table[i]
+        dg = g - table[i+1]
+        db = b - table[i+2]
+        distance = dr*dr + dg*dg + db*db
+        if distance < best_distance:
+            best_distance = distance
+            best_index = index
+        i += 3
+        index += 1
+    return best_index
+
+def build_lut(table):
+    """Precompute the nearest palette index for the center of every 16x16x16 cell"""
+    lut = bytearray(16 * 16 * 16)
+    i = 0
+    for r in range(8, 256, 16):
+        for g in range(8, 256, 16):
+            for b in range(8, 256, 16):
+                lut[i] = nearest_index(table, r, g, b)
+                i += 1
+    return lut
@@ -0,0 +1,139 @@
+# Section timing and heap tracking for the firmware main loop.
+# Built on time.ticks_us() and gc.mem_free(); recording only writes into
+# arrays allocated up front, so profiling doesn't allocate (and so doesn't
+# trigger garbage collections) in the loop it measures. Only report()
+# allocates. Also runs under CPython, where gc.mem_free() doesn't exist.
+import gc
+from array import array
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+try:
+    mem_free = gc.mem_free
+except AttributeError:
+    def mem_free():
+        return 0
+
+
+class Profiler:
+    """
+    Times named sections of a loop.
+
+    Call begin() at the top of each loop, lap(section) after each section
+    (section is an index into `sections`) and end() at the bottom.
+    Count, total and max per section accumulate until the next report(),
+    and the latest `size` section timings since then are kept in a ring
+    for percentiles, so every figure in a report covers the same loops.
+    With report_every set, end() prints a report every that many loops.
+    A disabled profiler returns from every call straight away. Totals are
+    32-bit, so report at least every few hours of measured time.
+    """
+
+    def __init__(self, sections, size=256, report_every=0, enabled=True):
+        self.sections = sections
+        self.size = size
+        self.report_every = report_every
+        self.enabled = enabled
+        n = len(sections)
+        # Ring of the latest timings: section index and duration in µs
+        self.ring_section = bytearray(size)
+        self.ring_us = array('l', [0] * size)
+        self.head = 0
+        self.filled = 0
+        # Per-section totals since the last report
+        self.count = array('l', [0] * n)
+        self.total_us = array('l', [0] * n)
+        self.max_us = array('l', [0] * n)
+        self.loops = 0
+        self.loop_max_us = 0
+        # Heap: free bytes at the start of the loop, and bytes allocated during it
+        self.mem_before = 0
+        self.mem_min = 0
+        self.alloc_last = 0
+        self.alloc_max = 0
+        self.loop_start = 0
+        self.mark = 0
+
+    def reset(self):
+        for i in range(len(self.sections)):
+            self.count[i] = 0
+            self.total_us[i] = 0
+            self.max_us[i] = 0
+        self.head = 0
+        self.filled = 0
+        self.loops = 0
+        self.loop_max_us = 0
+        self.mem_min = 0
+        self.alloc_max = 0
+
+    def begin(self):
+        if not self.enabled:
+            return
+        self.mem_before = mem_free()
+        self.loop_start = self.mark = ticks_us()
+
+    def lap(self, section):
+        """Record the time since begin() or the previous lap() as `section`"""
+        if not self.enabled:
+            return
+        now = ticks_us()
+        us = ticks_diff(now, self.mark)
+        self.mark = now
+        i = self.head
+        self.ring_section[i] = section
+        self.ring_us[i] = us
+        i += 1
+        self.head = 0 if i == self.size else i
+        if self.filled < self.size:
+            self.filled += 1
+        self.count[section] += 1
+        self.total_us[section] += us
+        if us > self.max_us[section]:
+            self.max_us[section] = us
+
+    def end(self):
+        if not self.enabled:
+            return
+        us = ticks_diff(ticks_us(), self.loop_start)
+        if us > self.loop_max_us:
+            self.loop_max_us = us
+        after = mem_free()
+        # Negative when a collection ran during the loop
+        self.alloc_last = self.mem_before - after
+        if self.alloc_last > self.alloc_max:
+            self.alloc_max = self.alloc_last
+        if self.mem_min == 0 or after < self.mem_min:
+            self.mem_min = after
+        self.loops += 1
+        if self.report_every and self.loops >= self.report_every:
+            self.report()
+
+    def percentiles(self, section):
+        """Median and 95th percentile (µs) of the section's timings in the ring"""
+        values = sorted(self.ring_us[i] for i in range(self.filled) if self.ring_section[i] == section)
+        if not values:
+            return 0, 0
+        return values[len(values) // 2], values[min(len(values) - 1, len(values) * 95 // 100)]
+
+    def report(self):
+        """Print a summary of the loops since the last report, then start over"""
+        print("Profile: {} loops, max loop {} us".format(self.loops, self.loop_max_us))
+        for i in range(len(self.sections)):
+            n = self.count[i]
+            if n == 0:
+                continue
+            p50, p95 = self.percentiles(i)
+            print("  {:<8} n={:<5} mean={:<7} p50={:<7} p95={:<7} max={} us".format(
+                self.sections[i], n, self.total_us[i] // n, p50, p95, self.max_us[i]))
+        print("  heap: {} B free (min {}), {} B allocated last loop (max {})".format(
+            mem_free(), self.mem_min, self.alloc_last, self.alloc_max))
+        self.reset()
@@ -0,0 +1,114 @@
+# Fixed-size ring buffer of raw RGBC samples with running and windowed filters.
+# Works on both MicroPython (the Pico firmware) and CPython (the host lrv.py):
+# all storage is allocated up front, so pushing and filtering don't allocate.
+from array import array
+
+MEAN = 'mean'
+MEDIAN = 'median'
+TRIMMED = 'trimmed'
+
+
+class SampleRing:
+    def __init__(self, size, trim=1):
+        self.size = size
+        # Samples dropped from each end of the sorted window by trimmed_mean
+        self.trim = trim
+        # Interleaved r, g, b, c per slot
+        self.samples = array('H', [0] * (4 * size))
+        self.scratch = array('H', [0] * size)
+        self.out = [0, 0, 0, 0]
+        self.sums = [0, 0, 0, 0]
+        self.head = 0
+        self.count = 0
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        sums = self.sums
+        sums[0] = sums[1] = sums[2] = sums[3] = 0
+
+    def push(self, r, g, b, c):
+        """Add a sample, overwriting the oldest one once the ring is full (O(1))"""
+        samples = self.samples
+        sums = self.sums
+        i = 4 * self.head
+        if self.count == self.size:
+            sums[0] -= samples[i]
+            sums[1] -= samples[i+1]
+            sums[2] -= samples[i+2]
+            sums[3] -= samples[i+3]
+        else:
+            self.count += 1
+        samples[i] = r
+        samples[i+1] = g
+        samples[i+2] = b
+        samples[i+3] = c
+        sums[0] += r
+        sums[1] += g
+        sums[2] += b
+        sums[3] += c
+        self.head += 1
+        if self.head == self.size:
+            self.head = 0
+
+    @property
+    def full(self):
+        return self.count == self.size
+
+    def mean(self, channel):
+        """Running mean of one channel (0=r, 1=g, 2=b, 3=c), rounded to an integer"""
+        n = self.count
+        if n == 0:
+            return 0
+        return (self.sums[channel] + n // 2) // n
+
+    def _sorted_window(self, channel):
+        """Copy one channel into the scratch array and insertion-sort it in place"""
+        samples = self.samples
+        scratch = self.scratch
+        n = self.count
+        for i in range(n):
+            value = samples[4*i + channel]
+            j = i - 1
+            while j >= 0 and scratch[j] > value:
+                scratch[j+1] = scratch[j]
+                j -= 1
+            scratch[j+1] = value
+        return n
+
+    def median(self, channel):
+        n = self._sorted_window(channel)
+        if n == 0:
+            return 0
+        middle = n // 2
+        if n & 1:
+            return self.scratch[middle]
+        return (self.scratch[middle-1] + self.scratch[middle] + 1) // 2
+
+    def trimmed_mean(self, channel):
+        """Mean of one channel with the `trim` lowest and highest samples left out"""
+        n = self._sorted_window(channel)
+        trim = self.trim
+        if n <= 2 * trim:
+            return self.median(channel)
+        total = 0
+        for i in range(trim, n - trim):
+            total += self.scratch[i]
+        kept = n - 2 * trim
+        return (total + kept // 2) // kept
+
+    def filtered(self, method=MEDIAN):
+        """
+        Filter every channel of the window with `method` (MEAN, MEDIAN or TRIMMED).
+
+        Returns the ring's own [r, g, b, c] list, overwritten on the next call.
+        """
+        out = self.out
+        for channel in range(4):
+            if method == MEAN:
+                out[channel] = self.mean(channel)
+            elif method == TRIMMED:
+                out[channel] = self.trimmed_mean(channel)
+            else:
+                out[channel] = self.median(channel)
+        return out
@@ -0,0 +1,70 @@
+# Fakes of the Pico's MicroPython modules, so the firmware in LR/ runs on
+# Linux under CPython or the unix port of MicroPython:
+#
+#   import shims
+#   shims.install()
+#   import lrv
+#
+# The buses record their transactions and byte counts (see machine.Bus),
+# and the BH1745 plays back readings set with breakout_bh1745.script().
+import sys
+import time
+
+TICKS_PERIOD = 1 << 30
+
+
+def ticks_ms():
+    return int(time.monotonic() * 1000) & (TICKS_PERIOD - 1)
+
+
+def ticks_us():
+    return int(time.monotonic() * 1000000) & (TICKS_PERIOD - 1)
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & (TICKS_PERIOD - 1)
+
+
+def ticks_diff(ticks1, ticks2):
+    """Signed difference of two ticks values, wrapping around like MicroPython's"""
+    half = TICKS_PERIOD // 2
+    return ((ticks1 - ticks2 + half) & (TICKS_PERIOD - 1)) - half
+
+
+def sleep_ms(ms):
+    if ms > 0:
+        time.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    if us > 0:
+        time.sleep(us / 1000000)
+
+
+def install():
+    """
+    Register the fakes under the names the firmware imports. machine and
+    the Pimoroni modules are always replaced; framebuf and micropython
+    only when the interpreter has none. Adds MicroPython's ticks and
+    sleep functions to the time module where they are missing.
+    """
+    from . import machine, pimoroni_i2c, breakout_bh1745
+    sys.modules['machine'] = machine
+    sys.modules['pimoroni_i2c'] = pimoroni_i2c
+    sys.modules['breakout_bh1745'] = breakout_bh1745
+
+    try:
+        import framebuf
+    except ImportError:
+        from . import framebuf
+        sys.modules['framebuf'] = framebuf
+
+    try:
+        import micropython
+    except ImportError:
+        from . import micropython
+        sys.modules['micropython'] = micropython
+
+    if not hasattr(time, 'ticks_ms'):
+        for func in (ticks_ms, ticks_us, ticks_add, ticks_diff, sleep_ms, sleep_us):
+            setattr(time, func.__name__, func)
@@ -0,0 +1,70 @@
+# Fake breakout_bh1745 module: a BH1745 that plays back scripted readings.
+# Each call makes the same bus transactions as the real driver, so they
+# show up in the I2C bus's counts.
+
+ADDRESS = 0x38
+REG_MODE_CONTROL1 = 0x41
+REG_RED_DATA = 0x50
+REG_INTERRUPT = 0x60
+
+MEASUREMENT_TIMES_MS = (160, 320, 640, 1280, 2560, 5120)
+
+# Readings new sensors play back, set with script()
+readings = [(1000, 1500, 800, 4000)]
+repeat = True
+
+
+def script(new_readings, new_repeat=True):
+    """
+    Set the (r, g, b, c) raw readings that sensors created from now on
+    return, in turn. With new_repeat off, a sensor raises
+    KeyboardInterrupt once they run out, like Ctrl-C on the Pico, which
+    ends the firmware's main loop.
+    """
+    global readings, repeat
+    readings = list(new_readings)
+    repeat = new_repeat
+
+
+class BreakoutBH1745:
+    def __init__(self, i2c, address=ADDRESS):
+        self.i2c = i2c
+        self.address = address
+        self.readings = readings
+        self.repeat = repeat
+        self.index = 0
+        self.led_state = False
+        self.measurement_ms = 320
+
+    def rgbc_raw(self):
+        if self.index == len(self.readings):
+            if not self.repeat:
+                raise KeyboardInterrupt
+            self.index = 0
+        reading = self.readings[self.index]
+        self.index += 1
+        self.i2c.readfrom_mem(self.address, REG_RED_DATA, 8)
+        return tuple(reading)
+
+    def rgbc_clamped(self):
+        r, g, b, c = self.rgbc_raw()
+        vmax = max(r, g, b)
+        if vmax == 0:
+            return (0, 0, 0, c)
+        return (r * 255 // vmax, g * 255 // vmax, b * 255 // vmax, c)
+
+    def rgbc_scaled(self):
+        r, g, b, c = self.rgbc_raw()
+        if c == 0:
+            return (0, 0, 0, c)
+        return (min(255, r * 255 // c), min(255, g * 255 // c), min(255, b * 255 // c), c)
+
+    def leds(self, state):
+        self.led_state = bool(state)
+        self.i2c.writeto_mem(self.address, REG_INTERRUPT, bytes((0x01 if state else 0x00,)))
+
+    def measurement_time_ms(self, ms):
+        if ms not in MEASUREMENT_TIMES_MS:
+            raise ValueError("invalid measurement time")
+        self.measurement_ms = ms
+        self.i2c.writeto_mem(self.address, REG_MODE_CONTROL1, bytes((MEASUREMENT_TIMES_MS.index(ms),)))
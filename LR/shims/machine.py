@@ -0,0 +1,131 @@
+# Fake machine module: pins that hold a value and I2C/SPI buses that
+# record every transaction instead of talking to hardware.
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._value = value or 0
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if value is not None:
+            self._value = value
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def __call__(self, value=None):
+        return self.value(value)
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+
+class Bus:
+    """
+    Counts the transactions and bytes sent over a bus.
+
+    With log set, each transaction is also appended to `log` as
+    (operation, address, bytes) for tests to look at; leave it off when
+    benchmarking, as the log grows without bound.
+    """
+
+    def __init__(self, log=False):
+        self.log = [] if log else None
+        self.reset()
+
+    def reset(self):
+        """Zero the counters and clear the log"""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        if self.log is not None:
+            self.log.clear()
+
+    def _write(self, operation, address, data):
+        self.transactions += 1
+        self.bytes_written += len(data)
+        if self.log is not None:
+            self.log.append((operation, address, bytes(data)))
+        return len(data)
+
+    def _read(self, operation, address, n):
+        self.transactions += 1
+        self.bytes_read += n
+        data = bytes(n)
+        if self.log is not None:
+            self.log.append((operation, address, data))
+        return data
+
+
+class I2C(Bus):
+    """I2C controller; devices answer reads with zeros, and scan() finds `devices`"""
+
+    def __init__(self, id=-1, scl=None, sda=None, freq=400000, timeout=50000, devices=(), log=False):
+        super().__init__(log)
+        self.id = id
+        self.freq = freq
+        self.devices = list(devices)
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def writeto(self, addr, buf, stop=True):
+        return self._write('writeto', addr, buf)
+
+    def writevto(self, addr, vector, stop=True):
+        data = bytearray()
+        for buf in vector:
+            data.extend(buf)
+        return self._write('writevto', addr, data)
+
+    def readfrom(self, addr, nbytes, stop=True):
+        return self._read('readfrom', addr, nbytes)
+
+    def readfrom_into(self, addr, buf, stop=True):
+        buf[:] = self._read('readfrom', addr, len(buf))
+
+    def writeto_mem(self, addr, memaddr, buf, addrsize=8):
+        self._write('writeto_mem', addr, bytes((memaddr,)) + bytes(buf))
+
+    def readfrom_mem(self, addr, memaddr, nbytes, addrsize=8):
+        # The register address goes out first, as on the wire
+        self.bytes_written += 1
+        return self._read('readfrom_mem', addr, nbytes)
+
+    def readfrom_mem_into(self, addr, memaddr, buf, addrsize=8):
+        buf[:] = self.readfrom_mem(addr, memaddr, len(buf), addrsize)
+
+
+SoftI2C = I2C
+
+
+class SPI(Bus):
+    """SPI controller; reads return zeros"""
+
+    def __init__(self, id=-1, baudrate=1000000, polarity=0, phase=0, log=False, **kwargs):
+        super().__init__(log)
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=1000000, polarity=0, phase=0, **kwargs):
+        self.baudrate = baudrate
+
+    def write(self, buf):
+        self._write('write', None, buf)
+
+    def read(self, nbytes, write=0x00):
+        return self._read('read', None, nbytes)
+
+
+SoftSPI = SPI
@@ -0,0 +1,17 @@
+# Fake micropython module: const() and the code emitter decorators are no-ops.
+
+
+def const(value):
+    return value
+
+
+def native(func):
+    return func
+
+
+def viper(func):
+    return func
+
+
+def alloc_emergency_exception_buf(size):
+    pass
@@ -0,0 +1,7 @@
+# Fake pimoroni_i2c module: PimoroniI2C is a recording machine.I2C.
+from .machine import I2C
+
+
+class PimoroniI2C(I2C):
+    def __init__(self, sda, scl, baudrate=400000, log=False):
+        super().__init__(0, scl=scl, sda=sda, freq=baudrate, devices=(0x38,), log=log)
@@ -33,11 +33,17 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        self.view = memoryview(self.buffer)
+        # What the display RAM holds, as of the last show()
+        self.shadow = bytearray(len(self.buffer))
+        self.full_refresh = True
+        # Column and page window command sequence, filled in by set_window()
+        self.window = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds(bytes((
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -67,12 +73,16 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )))
         self.fill(0)
         self.show()
 
+    def write_cmds(self, cmds):
+        """Send a sequence of commands; interfaces that can send them in one transfer override this"""
+        for cmd in cmds:
+            self.write_cmd(cmd)
+
     def poweroff(self):
         self.write_cmd(SET_DISP | 0x00)
 
@@ -86,20 +96,55 @@ class SSD1306(framebuf.FrameBuffer):
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def invalidate(self):
+        """Send the whole buffer on the next show(), e.g. after the display was reset"""
+        self.full_refresh = True
+
+    def set_window(self, x0, x1, page0, page1):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        window = self.window
+        window[1] = x0
+        window[2] = x1
+        window[4] = page0
+        window[5] = page1
+        self.write_cmds(window)
+
+    def show(self, full=False):
+        """
+        Send the frame buffer to the display.
+
+        Only pages that changed since the last show() are sent, each from
+        its first to its last changed column. full=True sends everything.
+        """
+        buffer = self.buffer
+        shadow = self.shadow
+        if full or self.full_refresh:
+            self.full_refresh = False
+            self.set_window(0, self.width - 1, 0, self.pages - 1)
+            self.write_data(buffer)
+            shadow[:] = buffer
+            return
+        if buffer == shadow:
+            return
+        width = self.width
+        view = self.view
+        for page in range(self.pages):
+            start = page * width
+            end = start + width
+            first = start
+            while first < end and buffer[first] == shadow[first]:
+                first += 1
+            if first == end:
+                continue
+            last = end - 1
+            while buffer[last] == shadow[last]:
+                last -= 1
+            self.set_window(first - start, last - start, page, page)
+            self.write_data(view[first:last + 1])
+            shadow[first:last + 1] = view[first:last + 1]
 
 
 class SSD1306_I2C(SSD1306):
@@ -108,6 +153,7 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
@@ -115,6 +161,10 @@ class SSD1306_I2C(SSD1306):
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
 
+    def write_cmds(self, cmds):
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
@@ -130,6 +180,10 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.cmd = bytearray(1)
+        # Set up once; re-init the bus before show() if it is shared with
+        # devices that need other settings
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
         import time
 
         self.res(1)
@@ -140,15 +194,17 @@ class SSD1306_SPI(SSD1306):
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cmd[0] = cmd
+        self.write_cmds(self.cmd)
+
+    def write_cmds(self, cmds):
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs(1)
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(1)
         self.cs(0)
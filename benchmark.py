@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+BENCH_OUTPUT = "bench_results.json"
+
+# A benchmark that got this much slower than the baseline is reported as a regression
+REGRESSION_THRESHOLD = 0.10
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+FIRMWARE_DIR = os.path.join(ROOT, 'LR')
+
+
+def measure(func, min_time=0.5, batches=20):
+    """
+    Time func() and return throughput and per-call latency statistics.
+
+    Calls are timed in batches sized so each batch takes about
+    min_time / batches; latency percentiles are taken over the batch means.
+    """
+    func()  # warm-up
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / batches or calls >= 1 << 20:
+            break
+        calls *= 2
+
+    samples = []
+    total_calls = 0
+    total_time = 0.0
+    for _ in range(batches):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed / calls)
+        total_calls += calls
+        total_time += elapsed
+
+    samples.sort()
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(p * len(samples)))] * 1e6
+
+    return {
+        'ops_per_sec': total_calls / total_time,
+        'mean_us': total_time / total_calls * 1e6,
+        'min_us': samples[0] * 1e6,
+        'p50_us': percentile(0.50),
+        'p95_us': percentile(0.95),
+        'p99_us': percentile(0.99),
+        'calls': total_calls
+    }
+
+
+def cycle(values):
+    """Return a function giving the next value of values on every call"""
+    state = {'i': 0}
+    n = len(values)
+
+    def next_value():
+        i = state['i']
+        state['i'] = i + 1 if i + 1 < n else 0
+        return values[i]
+    return next_value
+
+
+def random_rgbc(n, seed=1):
+    rng = random.Random(seed)
+    return [(rng.randrange(65536), rng.randrange(65536), rng.randrange(65536), rng.randrange(1, 65536))
+            for _ in range(n)]
+
+
+def import_firmware():
+    """Import LR/lrv.py as the top-level module `firmware_lrv`"""
+    import importlib.util
+    sys.path.insert(0, FIRMWARE_DIR)
+    try:
+        import shims
+        shims.install()
+        spec = importlib.util.spec_from_file_location('firmware_lrv', os.path.join(FIRMWARE_DIR, 'lrv.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        sys.path.remove(FIRMWARE_DIR)
+
+
+def host_math_benchmarks():
+    from reading import calculate_lrv, get_corrected_rgb
+    samples = cycle(random_rgbc(1024))
+    return {
+        'host.calculate_lrv': lambda: calculate_lrv(*samples(), 100.0),
+        'host.get_corrected_rgb': lambda: get_corrected_rgb(*samples()),
+    }
+
+
+def host_render_benchmarks():
+    from PIL import Image, ImageDraw
+    from hardware import NullDisplay
+    from reading import Reading
+    from renderer import FrameRenderer, draw_bar
+    import lrv
+
+    lrv.load_fonts()
+    lrv.device = NullDisplay()
+    lrv.renderer = FrameRenderer(lrv.device.width, lrv.device.height, lrv.font, lrv.large_font)
+    lrv.scaling_factor = 100.0
+    image = Image.new('1', (lrv.device.width, lrv.device.height))
+    draw = ImageDraw.Draw(image)
+    values = cycle(list(range(256)))
+
+    frames = []
+    for r, g, b, c in random_rgbc(256):
+        reading = Reading(r, g, b, c, 0.0)
+        rgb = reading.corrected()
+        frames.append(lrv.Frame(
+            color_hex="#{:02x}{:02x}{:02x}".format(*rgb),
+            color_name='Light Grayish Blue',
+            lrv=reading.lrv(100.0),
+            rgb=rgb,
+            reading=reading
+        ))
+    next_frame = cycle(frames)
+
+    return {
+        'host.draw_bar': lambda: draw_bar(draw, 40, values(), "R:", lrv.font),
+        'host.render_frame': lambda: lrv.display(next_frame()),
+    }
+
+
+def firmware_bus_traffic(firmware, frames=256):
+    """Print the OLED bus traffic per frame for changing readings, as sent and with every frame in full"""
+    readings = random_rgbc(frames)
+    bus = firmware.i2c_display
+    for full in (False, True):
+        bus.reset()
+        for rgbc in readings:
+            rgb_scaled = firmware.rgbc_scaled(rgbc)
+            if full:
+                firmware.oled.invalidate()
+            firmware.display_readings(rgb_scaled, firmware.find_nearest_color(*rgb_scaled),
+                                      firmware.calculate_lrv_tenths(*rgbc))
+        label = 'firmware.display_bus_full' if full else 'firmware.display_bus'
+        print(f"{label:36s} {bus.transactions / frames:12.1f} transactions/frame  "
+              f"{bus.bytes_written / frames:9.1f} bytes/frame")
+
+
+def firmware_benchmarks():
+    firmware = import_firmware()
+    firmware_bus_traffic(firmware)
+    samples = cycle(random_rgbc(1024))
+    colors = cycle([tuple(random.Random(i).randrange(256) for _ in range(3)) for i in range(1024)])
+
+    def nearest_uncached():
+        firmware.last_color[0] = -1
+        return firmware.find_nearest_color(*colors(), 0)
+
+    benchmarks = {
+        'firmware.find_nearest_color': nearest_uncached,
+        'firmware.find_nearest_color_memo': lambda: firmware.find_nearest_color(10, 20, 30, 0),
+        'firmware.calculate_lrv_tenths': lambda: firmware.calculate_lrv_tenths(*samples()),
+        'firmware.display_readings': lambda: firmware.display_readings((12, 200, 99, 0), 'Turquoise', 456),
+    }
+
+    lut = firmware.build_color_lut()
+
+    def nearest_lut():
+        firmware.color_lut = lut
+        firmware.last_color[0] = -1
+        try:
+            return firmware.find_nearest_color(*colors(), 0)
+        finally:
+            firmware.color_lut = None
+    benchmarks['firmware.find_nearest_color_lut'] = nearest_lut
+    return benchmarks
+
+
+def web_benchmarks():
+    import web_interface
+    client = web_interface.app.test_client()
+    web_interface.update_data('#12c863', 'Turquoise', 45.6,
+                              {'r': 18, 'g': 200, 'b': 99},
+                              {'r': 1200, 'g': 1800, 'b': 1100, 'c': 4000})
+    etag = client.get('/data').headers['ETag']
+    return {
+        'web.data': lambda: client.get('/data'),
+        'web.data_not_modified': lambda: client.get('/data', headers={'If-None-Match': etag}),
+        'web.index': lambda: client.get('/'),
+    }
+
+
+SUITES = {
+    'math': host_math_benchmarks,
+    'render': host_render_benchmarks,
+    'firmware': firmware_benchmarks,
+    'web': web_benchmarks,
+}
+
+
+def run(suites, min_time):
+    results = {}
+    for suite in suites:
+        try:
+            benchmarks = SUITES[suite]()
+        except ImportError as e:
+            print(f"Skipping {suite} benchmarks: {e}")
+            continue
+        for name, func in benchmarks.items():
+            result = measure(func, min_time=min_time)
+            results[name] = result
+            print(f"{name:36s} {result['ops_per_sec']:12.0f} ops/s  "
+                  f"p50 {result['p50_us']:9.2f} us  p99 {result['p99_us']:9.2f} us")
+    return results
+
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """Print the change against a previous run; return the names that got slower"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    regressions = []
+    print(f"\nCompared with {baseline_path}:")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['mean_us'] / baseline[name]['mean_us'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:36s} {change:+8.1%}{flag}")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the LRV hot paths')
+    parser.add_argument('suites', nargs='*', metavar='suite',
+                        help=f"Suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument('--output', '-o', default=BENCH_OUTPUT,
+                        help=f'JSON file to write the results to (default {BENCH_OUTPUT})')
+    parser.add_argument('--compare',
+                        help='Results JSON of an earlier run to compare against')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='Seconds spent measuring each benchmark (default 0.5)')
+    args = parser.parse_args()
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error(f"unknown suite {suite!r}")
+    args.suites = args.suites or list(SUITES)
+    return args
+
+
+def main():
+    args = parse_args()
+    sys.path.insert(0, ROOT)
+    results = run(args.suites, args.min_time)
+
+    with open(args.output, 'w') as f:
+        json.dump({
+            'date': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'results': results
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
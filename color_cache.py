@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from colorspace import hex_to_rgb, rgb_to_hex, rgb_to_lab, delta_e
+
+COLOR_CACHE_FILE = "color_name_cache.db"
+
+# Entries kept in memory; the on-disk store is not limited
+MAX_ENTRIES = 256
+
+# Colors closer than this (CIE76 delta E) share a name. 2.3 is roughly
+# the smallest difference a person can see.
+TOLERANCE = 2.3
+
+# Low bits dropped from each channel to build the cache key, so a hex
+# that wobbles by a count or two maps to the same entry
+QUANTIZE_BITS = 2
+
+
+class ColorNameCache:
+    """
+    Color-name cache: an in-memory LRU in front of an SQLite store.
+
+    Lookups first try the quantized key, then any cached color within
+    `tolerance` of the requested one. Hits and misses are counted so the
+    number of saved API calls can be reported.
+    """
+
+    def __init__(self, path=COLOR_CACHE_FILE, max_entries=MAX_ENTRIES,
+                 tolerance=TOLERANCE, quantize_bits=QUANTIZE_BITS):
+        self.path = path
+        self.max_entries = max_entries
+        self.tolerance = tolerance
+        self.quantize_bits = quantize_bits
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (lab, name)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS color_names ("
+                "key TEXT PRIMARY KEY, l REAL, a REAL, b REAL, name TEXT)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS color_names_l ON color_names (l)")
+            self._db.commit()
+
+    def key(self, r, g, b):
+        q = self.quantize_bits
+        return rgb_to_hex((r >> q) << q, (g >> q) << q, (b >> q) << q)
+
+    def get(self, hex_color):
+        """Return the cached name for hex_color, or None on a miss"""
+        r, g, b = hex_to_rgb(hex_color)
+        key = self.key(r, g, b)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                lab = rgb_to_lab(r, g, b)
+                entry = self._find_near(lab)
+                if entry is None:
+                    entry = self._load(key, lab)
+                    if entry is not None:
+                        self.disk_hits += 1
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+            self.hits += 1
+            return entry[1]
+
+    def put(self, hex_color, name):
+        if name is None:
+            return
+        r, g, b = hex_to_rgb(hex_color)
+        key = self.key(r, g, b)
+        lab = rgb_to_lab(r, g, b)
+        with self._lock:
+            self._entries[key] = (lab, name)
+            self._entries.move_to_end(key)
+            self._evict()
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO color_names VALUES (?, ?, ?, ?, ?)",
+                    (key, lab[0], lab[1], lab[2], name)
+                )
+                self._db.commit()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _find_near(self, lab):
+        if self.tolerance <= 0:
+            return None
+        best = None
+        best_distance = self.tolerance
+        for entry in self._entries.values():
+            distance = delta_e(lab, entry[0])
+            if distance <= best_distance:
+                best, best_distance = entry, distance
+        return best
+
+    def _load(self, key, lab):
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT l, a, b, name FROM color_names WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None and self.tolerance > 0:
+            # Search a box around the color, then keep the closest inside the sphere
+            t = self.tolerance
+            rows = self._db.execute(
+                "SELECT l, a, b, name FROM color_names "
+                "WHERE l BETWEEN ? AND ? AND a BETWEEN ? AND ? AND b BETWEEN ? AND ?",
+                (lab[0] - t, lab[0] + t, lab[1] - t, lab[1] + t, lab[2] - t, lab[2] + t)
+            ).fetchall()
+            best_distance = t
+            for candidate in rows:
+                distance = delta_e(lab, candidate[:3])
+                if distance <= best_distance:
+                    row, best_distance = candidate, distance
+        if row is None:
+            return None
+        return (tuple(row[:3]), row[3])
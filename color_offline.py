@@ -0,0 +1,86 @@
+from colorspace import hex_to_lab, rgb_to_lab, hex_to_rgb
+from color_data import CSS_COLORS, EXTENDED_COLORS
+
+# Offline name lookups remembered per exact color
+MEMO_SIZE = 4096
+
+
+class KDTree:
+    """
+    Static 3-d tree for nearest-neighbour queries.
+
+    Each node is a tuple (point, index, axis, left, right); `index`
+    refers to the position of `point` in the list passed to the tree.
+    """
+
+    def __init__(self, points):
+        self.root = self._build([(point, i) for i, point in enumerate(points)], 0)
+
+    def _build(self, items, depth):
+        if not items:
+            return None
+        axis = depth % 3
+        items.sort(key=lambda item: item[0][axis])
+        middle = len(items) // 2
+        point, index = items[middle]
+        return (
+            point, index, axis,
+            self._build(items[:middle], depth + 1),
+            self._build(items[middle + 1:], depth + 1)
+        )
+
+    def nearest(self, target):
+        """Return (index, squared distance) of the point closest to target"""
+        best_index = -1
+        best_distance = float('inf')
+        # Entries are (node, squared distance from target to the node's region bound)
+        stack = [(self.root, 0.0)]
+        while stack:
+            node, bound = stack.pop()
+            if node is None or bound >= best_distance:
+                continue
+            point, index, axis, left, right = node
+            d0 = point[0] - target[0]
+            d1 = point[1] - target[1]
+            d2 = point[2] - target[2]
+            distance = d0 * d0 + d1 * d1 + d2 * d2
+            if distance < best_distance:
+                best_index, best_distance = index, distance
+
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # The far side is pushed first so the near side is searched (and
+            # tightens the bound) before it is considered
+            stack.append((far, diff * diff))
+            stack.append((near, bound))
+        return best_index, best_distance
+
+
+class OfflineColorNamer:
+    """
+    Name colors without a network connection.
+
+    The named colors are converted to CIELAB once, and queries look up the
+    perceptually closest name through a k-d tree.
+    """
+
+    def __init__(self, colors=CSS_COLORS + EXTENDED_COLORS):
+        self.names = [name for name, _ in colors]
+        self.codes = [code for _, code in colors]
+        self.labs = [hex_to_lab(code) for code in self.codes]
+        self.tree = KDTree(self.labs)
+        self._memo = {}
+
+    def nearest(self, hex_color):
+        """Return (name, delta E) of the closest named color"""
+        result = self._memo.get(hex_color)
+        if result is None:
+            index, distance = self.tree.nearest(rgb_to_lab(*hex_to_rgb(hex_color)))
+            result = (self.names[index], distance ** 0.5)
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.clear()
+            self._memo[hex_color] = result
+        return result
+
+    def name(self, hex_color):
+        return self.nearest(hex_color)[0]
@@ -0,0 +1,226 @@
+import threading
+import time
+import niquests as requests
+
+COLOR_API_URL = 'https://www.thecolorapi.com/id'
+
+# Hard limit in seconds for a single lookup, DNS and a slow body included
+REQUEST_DEADLINE = 5.0
+# Socket limits; these bound each wait on the socket, not the whole request
+REQUEST_TIMEOUT = requests.TimeoutConfiguration(connect=2.0, read=3.0, total=REQUEST_DEADLINE)
+
+# Open the circuit after this many consecutive failures...
+FAILURE_THRESHOLD = 3
+# ...and wait this many seconds before trying the API again
+RESET_TIMEOUT = 30.0
+
+
+def create_session():
+    """Create a single keep-alive session for all Color API lookups"""
+    return requests.Session(
+        pool_connections=1,
+        pool_maxsize=1,
+        retries=0,
+        timeout=REQUEST_TIMEOUT
+    )
+
+
+def fetch_color_name(session, hex_color, base_url=COLOR_API_URL, timeout=REQUEST_TIMEOUT):
+    """
+    Look up a color name over the network.
+
+    Returns the name (or None if the API does not know the color).
+    Raises on connection errors, timeouts and server errors so the
+    caller can count them as failures.
+    """
+    response = session.get(base_url, params={'hex': hex_color.lstrip('#')}, timeout=timeout)
+    if response.status_code >= 500:
+        raise IOError(f"Color API returned {response.status_code}")
+    if response.status_code != 200:
+        return None
+    return response.json()['name']['value']
+
+
+class CircuitBreaker:
+    """
+    Stop calling out after repeated failures.
+
+    closed    - calls go through
+    open      - calls are refused until reset_timeout has passed
+    half-open - a single trial call decides whether to close or re-open
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        return self.state != 'open'
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            # (Re-)open the circuit, also when a half-open trial fails
+            self.opened_at = time.monotonic()
+
+
+class ColorNameResolver:
+    """
+    Resolve color names on a background thread.
+
+    The main loop calls get() with the current hex and carries on; the
+    worker looks the color up and get() returns its name once it is
+    available, and None while it is pending. Only the most recent
+    request is kept, and a hex that is already pending, in flight or
+    resolved is not requested again. A lookup that takes longer than
+    `deadline` seconds is abandoned and counted as a failure.
+    Resolved names are stored in `cache` when one is given, and API call
+    times are observed into `timer` (a metrics Histogram) when one is given.
+    """
+
+    def __init__(self, base_url=COLOR_API_URL, timeout=REQUEST_TIMEOUT,
+                 deadline=REQUEST_DEADLINE, failure_threshold=FAILURE_THRESHOLD,
+                 reset_timeout=RESET_TIMEOUT, cache=None, timer=None):
+        self.base_url = base_url
+        self.cache = cache
+        self.timer = timer
+        self.timeout = timeout
+        self.deadline = deadline
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.latest_hex = None
+        self.latest_name = None
+        self.failures = 0
+        self._pending = None
+        self._in_flight = None
+        self._session = None
+        self._thread = None
+        self._running = False
+        self._condition = threading.Condition()
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='color-resolver', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def submit(self, hex_color):
+        """Queue a lookup for hex_color, replacing any older pending one"""
+        if not self._running:
+            self.start()
+        with self._condition:
+            if hex_color in (self._pending, self._in_flight, self.latest_hex):
+                return
+            self._pending = hex_color
+            self._condition.notify()
+
+    def get(self, hex_color):
+        """Submit hex_color and return its name once resolved, or None until then"""
+        self.submit(hex_color)
+        with self._condition:
+            # The latest name belongs to an older color while this one is pending
+            if self.latest_hex == hex_color:
+                return self.latest_name
+        return None
+
+    def _next_request(self):
+        with self._condition:
+            while self._running and self._pending is None:
+                self._condition.wait()
+            if not self._running:
+                return None
+            self._in_flight, self._pending = self._pending, None
+            return self._in_flight
+
+    def _fetch(self, hex_color):
+        """
+        Look hex_color up on a helper thread, waiting at most self.deadline.
+
+        Socket timeouts do not cover a slow DNS lookup or a response that
+        trickles in, so the wall-clock deadline is enforced here. An
+        overrunning lookup keeps its session, which it closes once it
+        returns, and the worker carries on with a new one.
+        """
+        session = self._session
+        result = {}
+        done = threading.Event()
+        lock = threading.Lock()
+        abandoned = False
+
+        def lookup():
+            try:
+                result['name'] = fetch_color_name(session, hex_color, self.base_url, self.timeout)
+            except Exception as error:
+                result['error'] = error
+            with lock:
+                done.set()
+                if abandoned:
+                    session.close()
+
+        threading.Thread(target=lookup, name='color-lookup', daemon=True).start()
+        if not done.wait(self.deadline):
+            with lock:
+                if not done.is_set():
+                    abandoned = True
+                    self._session = create_session()
+                    raise TimeoutError(f"Color API lookup took longer than {self.deadline}s")
+        if 'error' in result:
+            raise result['error']
+        return result['name']
+
+    def _run(self):
+        self._session = create_session()
+        try:
+            while True:
+                hex_color = self._next_request()
+                if hex_color is None:
+                    break
+                if not self.breaker.allow():
+                    with self._condition:
+                        self._in_flight = None
+                    continue
+                start = time.perf_counter()
+                try:
+                    name = self._fetch(hex_color)
+                except Exception:
+                    if self.timer is not None:
+                        self.timer.observe(time.perf_counter() - start)
+                    self.failures += 1
+                    self.breaker.record_failure()
+                    with self._condition:
+                        self._in_flight = None
+                    continue
+                if self.timer is not None:
+                    self.timer.observe(time.perf_counter() - start)
+                self.breaker.record_success()
+                if self.cache is not None:
+                    self.cache.put(hex_color, name)
+                with self._condition:
+                    self.latest_hex = hex_color
+                    self.latest_name = name
+                    self._in_flight = None
+        finally:
+            self._session.close()
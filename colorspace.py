@@ -0,0 +1,56 @@
+import math
+
+# D65 reference white
+REF_X = 0.95047
+REF_Y = 1.00000
+REF_Z = 1.08883
+
+
+def hex_to_rgb(hex_color):
+    """Convert hex color (#RRGGBB) to RGB tuple"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+def rgb_to_hex(r, g, b):
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _srgb_to_linear(value):
+    value = value / 255.0
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _lab_f(t):
+    if t > 216 / 24389:
+        return t ** (1 / 3)
+    return (24389 / 27 * t + 16) / 116
+
+
+def rgb_to_lab(r, g, b):
+    """Convert 8-bit sRGB to CIELAB (D65)"""
+    rl = _srgb_to_linear(r)
+    gl = _srgb_to_linear(g)
+    bl = _srgb_to_linear(b)
+
+    x = (0.4124564 * rl + 0.3575761 * gl + 0.1804375 * bl) / REF_X
+    y = (0.2126729 * rl + 0.7151522 * gl + 0.0721750 * bl) / REF_Y
+    z = (0.0193339 * rl + 0.1191920 * gl + 0.9503041 * bl) / REF_Z
+
+    fx, fy, fz = _lab_f(x), _lab_f(y), _lab_f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def hex_to_lab(hex_color):
+    return rgb_to_lab(*hex_to_rgb(hex_color))
+
+
+def delta_e(lab1, lab2):
+    """CIE76 color difference; ~2.3 is a just noticeable difference"""
+    return math.sqrt(
+        (lab1[0] - lab2[0]) ** 2 +
+        (lab1[1] - lab2[1]) ** 2 +
+        (lab1[2] - lab2[2]) ** 2
+    )
@@ -0,0 +1,209 @@
+import csv
+import os
+import random
+import threading
+import time
+from history import Segment, SEGMENT_SUFFIX
+
+# Sensor backends share the subset of the bh1745 library's BH1745 API that
+# lrv.py uses: setup(), set_leds(), set_measurement_time_ms() and
+# get_rgbc_raw(). Display backends share the luma device API: width,
+# height, display(image) and cleanup().
+
+SENSORS = ('bh1745', 'sim', 'replay')
+DISPLAYS = ('sh1106', 'null', 'memory')
+
+# The OLED fitted to the Pi: an SPI SH1106, mounted upside down
+DISPLAY_ARGS = [
+    '--display', 'sh1106',
+    '--height', '128',
+    '--rotate', '2',
+    '--interface', 'spi',
+    '--gpio-data-command', '9',
+    '--spi-device', '1'
+]
+
+# Raw reading the simulated sensor centers on: a mid-gray sample
+SIMULATED_RGBC = (1200, 1800, 1100, 4000)
+
+
+class SimulatedBH1745:
+    """
+    BH1745 stand-in producing noisy readings around a fixed color.
+
+    Like the real sensor, a new reading is only ready once per
+    measurement time; get_rgbc_raw() waits for it unless realtime is off.
+    """
+
+    def __init__(self, rgbc=SIMULATED_RGBC, noise=0.01, measurement_time_ms=320,
+                 realtime=True, seed=None):
+        self.rgbc = rgbc
+        self.noise = noise
+        self.measurement_time_ms = measurement_time_ms
+        self.realtime = realtime
+        self.leds = 0
+        self._random = random.Random(seed)
+        self._ready_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def setup(self):
+        pass
+
+    def set_leds(self, state):
+        self.leds = state
+
+    def set_measurement_time_ms(self, time_ms):
+        self.measurement_time_ms = time_ms
+
+    def get_rgbc_raw(self):
+        with self._lock:
+            if self.realtime:
+                now = time.monotonic()
+                if self._ready_at > now:
+                    time.sleep(self._ready_at - now)
+                    now = self._ready_at
+                self._ready_at = now + self.measurement_time_ms / 1000.0
+            return tuple(
+                max(0, min(65535, int(self._random.gauss(value, value * self.noise))))
+                for value in self.rgbc
+            )
+
+
+def read_trace(path):
+    """
+    Yield (timestamp, r, g, b, c) from a recorded trace.
+
+    Accepts history logs (a segment file or a directory of them) and CSV
+    files with timestamp and raw_r/raw_g/raw_b/raw_c columns, such as the
+    output of reprocess.py.
+    """
+    if path.endswith('.csv'):
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                yield (float(row['timestamp']), int(row['raw_r']), int(row['raw_g']),
+                       int(row['raw_b']), int(row['raw_c']))
+        return
+
+    if os.path.isdir(path):
+        paths = [os.path.join(path, n) for n in sorted(os.listdir(path)) if n.endswith(SEGMENT_SUFFIX)]
+    else:
+        paths = [path]
+    for segment_path in paths:
+        segment = Segment(segment_path)
+        try:
+            for i in range(segment.count):
+                yield segment.record(i)[:5]
+        finally:
+            segment.close()
+
+
+class ReplayBH1745:
+    """
+    BH1745 stand-in that plays back a recorded trace.
+
+    Readings are returned with their recorded spacing divided by `speed`;
+    speed 0 plays back as fast as they are requested. The trace starts
+    over when it runs out if `loop` is set, otherwise EOFError is raised.
+    """
+
+    def __init__(self, path, speed=1.0, loop=True):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.leds = 0
+        self._trace = read_trace(path)
+        self._first = None
+        self._started = None
+        self._lock = threading.Lock()
+
+    def setup(self):
+        pass
+
+    def set_leds(self, state):
+        self.leds = state
+
+    def set_measurement_time_ms(self, time_ms):
+        # Readings come at the recorded rate
+        pass
+
+    def _next(self):
+        try:
+            return next(self._trace)
+        except StopIteration:
+            if not self.loop:
+                raise EOFError(f"end of trace {self.path}")
+            self._trace = read_trace(self.path)
+            self._first = None
+            try:
+                return next(self._trace)
+            except StopIteration:
+                raise EOFError(f"trace {self.path} is empty")
+
+    def get_rgbc_raw(self):
+        with self._lock:
+            timestamp, r, g, b, c = self._next()
+            if self.speed > 0:
+                now = time.monotonic()
+                if self._first is None:
+                    self._first, self._started = timestamp, now
+                due = self._started + (timestamp - self._first) / self.speed
+                if due > now:
+                    time.sleep(due - now)
+            return (r, g, b, c)
+
+
+class NullDisplay:
+    """Display stand-in that throws frames away"""
+
+    def __init__(self, width=128, height=128):
+        self.width = width
+        self.height = height
+        self.frames = 0
+
+    def display(self, image):
+        self.frames += 1
+
+    def cleanup(self):
+        pass
+
+
+class MemoryDisplay(NullDisplay):
+    """Display stand-in that keeps the last frame, e.g. to save or inspect it"""
+
+    def __init__(self, width=128, height=128):
+        super().__init__(width, height)
+        self.image = None
+
+    def display(self, image):
+        super().display(image)
+        self.image = image.copy()
+
+
+def create_sensor(kind='bh1745', replay_file=None, replay_speed=1.0, noise=0.01):
+    """Create and set up the sensor backend named by kind (see SENSORS)"""
+    if kind == 'bh1745':
+        from bh1745 import BH1745
+        sensor = BH1745()
+    elif kind == 'sim':
+        sensor = SimulatedBH1745(noise=noise)
+    elif kind == 'replay':
+        if not replay_file:
+            raise ValueError("the replay sensor needs a trace file")
+        sensor = ReplayBH1745(replay_file, speed=replay_speed)
+    else:
+        raise ValueError(f"unknown sensor backend {kind!r}")
+    sensor.setup()
+    return sensor
+
+
+def create_display(kind='sh1106'):
+    """Create the display backend named by kind (see DISPLAYS)"""
+    if kind == 'sh1106':
+        from luma.core import cmdline
+        parser = cmdline.create_parser(description='LRV display')
+        return cmdline.create_device(parser.parse_args(DISPLAY_ARGS))
+    if kind == 'null':
+        return NullDisplay()
+    if kind == 'memory':
+        return MemoryDisplay()
+    raise ValueError(f"unknown display backend {kind!r}")
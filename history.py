@@ -0,0 +1,205 @@
+import mmap
+import os
+import struct
+import threading
+from array import array
+
+HISTORY_DIR = "history"
+
+# One record per reading: timestamp (unix seconds), raw r, g, b, c, LRV
+RECORD = struct.Struct('<dHHHHf')
+RECORD_SIZE = RECORD.size
+TIMESTAMP_OFFSET = 0
+LRV_OFFSET = 16
+
+# Start a new segment file once the current one reaches this size
+SEGMENT_SIZE = 64 * 1024 * 1024
+SEGMENT_SUFFIX = '.lrvlog'
+
+
+def _strided_array(view, typecode, offset, count):
+    """
+    Gather one fixed-width field of `count` records into an array.
+
+    Strided slicing copies the field's bytes without unpacking records in
+    Python, so a whole segment can be scanned at C speed.
+    """
+    values = array(typecode)
+    width = values.itemsize
+    buf = bytearray(width * count)
+    end = count * RECORD_SIZE
+    for i in range(width):
+        buf[i::width] = view[offset + i:end:RECORD_SIZE]
+    values.frombytes(buf)
+    return values
+
+
+class Segment:
+    """A read-only, memory-mapped history file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = os.path.getsize(path) // RECORD_SIZE
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.count else None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def record(self, index):
+        return RECORD.unpack_from(self._map, index * RECORD_SIZE)
+
+    def timestamp(self, index):
+        return struct.unpack_from('<d', self._map, index * RECORD_SIZE + TIMESTAMP_OFFSET)[0]
+
+    def bisect(self, timestamp):
+        """Index of the first record at or after timestamp"""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.timestamp(mid) < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def lrv_values(self, start, stop):
+        view = memoryview(self._map)[start * RECORD_SIZE:stop * RECORD_SIZE]
+        try:
+            return _strided_array(view, 'f', LRV_OFFSET, stop - start)
+        finally:
+            view.release()
+
+
+class HistoryStore:
+    """
+    Append-only log of readings in fixed-width binary records.
+
+    Records go to numbered segment files in `directory`; a new segment
+    is started once the current one reaches `segment_size` bytes. Reads
+    memory-map the segments and find time ranges by binary search, so a
+    query only touches the records it returns.
+
+    Binary search needs the timestamps of a segment in order, but the
+    wall clock can step backwards (a Pi has no RTC and gets set by NTP
+    after boot), so a record older than the one before it starts a new
+    segment.
+    """
+
+    def __init__(self, directory=HISTORY_DIR, segment_size=SEGMENT_SIZE):
+        self.directory = directory
+        self.segment_size = segment_size
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        paths = self.segment_paths()
+        self._number = int(os.path.basename(paths[-1])[:-len(SEGMENT_SUFFIX)]) if paths else 0
+        self._file = None
+        self._last_timestamp = None
+        self._open_segment(new=not paths)
+
+    def segment_paths(self):
+        names = sorted(n for n in os.listdir(self.directory) if n.endswith(SEGMENT_SUFFIX))
+        return [os.path.join(self.directory, n) for n in names]
+
+    def _open_segment(self, new):
+        if self._file is not None:
+            self._file.close()
+        if new:
+            self._number += 1
+        path = os.path.join(self.directory, f"{self._number:06d}{SEGMENT_SUFFIX}")
+        self._file = open(path, 'ab')
+        # Drop a partial record left by a crash so records stay aligned
+        size = self._file.tell()
+        if size % RECORD_SIZE:
+            size -= size % RECORD_SIZE
+            self._file.truncate(size)
+            self._file.seek(0, os.SEEK_END)
+        self._last_timestamp = None
+        if size:
+            with open(path, 'rb') as f:
+                f.seek(size - RECORD_SIZE + TIMESTAMP_OFFSET)
+                self._last_timestamp = struct.unpack('<d', f.read(8))[0]
+
+    def append(self, timestamp, r, g, b, c, lrv):
+        with self._lock:
+            if self._file.tell() >= self.segment_size or (
+                    self._last_timestamp is not None and timestamp < self._last_timestamp):
+                self._open_segment(new=True)
+            self._file.write(RECORD.pack(timestamp, r, g, b, c, lrv))
+            self._last_timestamp = timestamp
+            # Flushed so readers mapping the file see the record straight away
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def query(self, start, end, max_points=1000):
+        """
+        Return (count, records) for start <= timestamp < end.
+
+        When more than max_points records fall in the range they are
+        downsampled into buckets, keeping the records with the lowest and
+        highest LRV of every bucket so peaks survive.
+        """
+        with self._lock:
+            self._file.flush()
+        segments = [Segment(path) for path in self.segment_paths()]
+        try:
+            ranges = []
+            for segment in segments:
+                if segment.count == 0:
+                    continue
+                if segment.timestamp(0) >= end or segment.timestamp(segment.count - 1) < start:
+                    continue
+                lo = segment.bisect(start)
+                hi = segment.bisect(end)
+                if hi > lo:
+                    ranges.append((segment, lo, hi))
+
+            count = sum(hi - lo for _, lo, hi in ranges)
+            if count <= max_points:
+                return count, [segment.record(i) for segment, lo, hi in ranges for i in range(lo, hi)]
+            return count, self._downsample(ranges, count, max(2, max_points))
+        finally:
+            for segment in segments:
+                segment.close()
+
+    def _downsample(self, ranges, count, max_points):
+        buckets = max_points // 2
+        bucket_size = count / buckets
+        # Lowest and highest reading of each bucket as
+        # (lrv, global position, segment, index in segment)
+        lows = [None] * buckets
+        highs = [None] * buckets
+        # Global position of the first record of each range
+        offset = 0
+        for segment, lo, hi in ranges:
+            lrv = segment.lrv_values(lo, hi)
+            first_bucket = int(offset / bucket_size)
+            last_bucket = min(buckets - 1, int((offset + hi - lo - 1) / bucket_size))
+            for bucket in range(first_bucket, last_bucket + 1):
+                # Bucket bounds relative to this range; a bucket spanning two
+                # segments keeps the extremes of both parts
+                b_start = max(0, int(bucket * bucket_size) - offset)
+                b_stop = min(hi - lo, int((bucket + 1) * bucket_size) - offset)
+                if b_stop <= b_start:
+                    continue
+                low = lrv.index(min(lrv[b_start:b_stop]), b_start, b_stop)
+                high = lrv.index(max(lrv[b_start:b_stop]), b_start, b_stop)
+                if lows[bucket] is None or lrv[low] < lows[bucket][0]:
+                    lows[bucket] = (lrv[low], offset + low, segment, lo + low)
+                if highs[bucket] is None or lrv[high] > highs[bucket][0]:
+                    highs[bucket] = (lrv[high], offset + high, segment, lo + high)
+            offset += hi - lo
+        records = []
+        for low, high in zip(lows, highs):
+            if low is None:
+                continue
+            points = {low[1]: low, high[1]: high}
+            for position in sorted(points):
+                _, _, segment, i = points[position]
+                records.append(segment.record(i))
+        return records
@@ -1,39 +1,29 @@
 #!/usr/bin/env python
 import time
-import niquests as requests
-from bh1745 import BH1745
-from luma.core import cmdline
-from PIL import Image, ImageDraw, ImageFont
+# When this module started loading, for the --startup-time breakdown
+IMPORT_START = time.perf_counter()
 import json
 import os
 import argparse
 import threading
-from web_interface import start_server, update_data
-
-# Set up the BH1745 sensor
-bh1745 = BH1745()
-bh1745.setup()
-bh1745.set_leds(1)
-
-# Set up the display
-display_args = [
-    '--display', 'sh1106',
-    '--height', '128',
-    '--rotate', '2',
-    '--interface', 'spi',
-    '--gpio-data-command', '9',
-    '--spi-device', '1'
-]
-
-device = cmdline.create_device(cmdline.create_parser(description='LRV display').parse_args(display_args))
-
-# Create fonts - default for bars, larger for color display
-font = ImageFont.load_default()
-# Try to load a larger font - you might need to adjust the path based on your system
-try:
-    large_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-except IOError:
-    large_font = font  # Fallback to default if the font isn't available
+from collections import namedtuple
+from contextlib import contextmanager
+from color_cache import ColorNameCache, COLOR_CACHE_FILE, TOLERANCE
+from pipeline import LatestValue, Stage, Pipeline
+from reading import Reading
+from LR.ringbuffer import SampleRing, MEAN, MEDIAN, TRIMMED
+from history import HistoryStore, HISTORY_DIR
+from hardware import create_sensor, create_display, SENSORS, DISPLAYS
+from metrics import Registry
+
+# PIL, Flask and niquests take most of the startup time, so the subsystems
+# that need them (rendering, the web interface and the Color API) are only
+# imported by main() once the arguments say they are used
+
+# Fonts for the display, set by load_fonts(): default for bars, larger for color display
+font = None
+large_font = None
+LARGE_FONT_FILE = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
 
 # Add these constants near the top of the file, after the imports
 CALIBRATION_SAMPLES = {
@@ -44,13 +34,62 @@ CALIBRATION_SAMPLES = {
 
 CALIBRATION_FILE = "lrv_calibration.json"
 
-# Add these constants after the CALIBRATION_SAMPLES
-# Approximate peak sensitivity ratios from the graph
-SENSITIVITY_CORRECTIONS = {
-    'red': 0.7,    # Peak around 615nm with ~0.7 relative sensitivity
-    'green': 1.0,  # Peak around 540nm with ~1.0 relative sensitivity
-    'blue': 0.55   # Peak around 465nm with ~0.55 relative sensitivity
-}
+# Readings taken per calibration sample; a trimmed mean drops the outliers
+CALIBRATION_READINGS = 5
+
+# Measurement times supported by the BH1745; the library sets up 320 ms
+BH1745_MEASUREMENT_TIMES_MS = (160, 320, 640, 1280, 2560, 5120)
+BH1745_DEFAULT_MEASUREMENT_MS = 320
+MAX_SAMPLE_RATE = 1000.0 / BH1745_MEASUREMENT_TIMES_MS[0]
+
+# Subsystems set up by setup(), None until then or when not used
+device = None
+renderer = None
+history = None
+color_cache = None
+color_resolver = None
+offline_namer = None
+
+# Histograms timing the two halves of the display stage, set when --metrics is on
+render_timer = None
+push_timer = None
+
+# Everything the display, console and web interface show for one sample
+Frame = namedtuple('Frame', ['color_hex', 'color_name', 'lrv', 'rgb', 'reading'])
+
+class StartupTimer:
+    """Wall time of each import and initialization step of startup, for --startup-time"""
+
+    def __init__(self, start):
+        # Everything from loading this module up to now, argument parsing included
+        self.steps = [('lrv imports and arguments', time.perf_counter() - start)]
+        self.start = start
+
+    @contextmanager
+    def step(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - start))
+
+    def report(self):
+        total = time.perf_counter() - self.start
+        print("\nStartup time:")
+        for name, seconds in self.steps:
+            print(f"  {name:30s} {seconds * 1000:8.1f} ms {seconds / total:6.1%}")
+        print(f"  {'total':30s} {total * 1000:8.1f} ms")
+
+def load_fonts():
+    """Load the display fonts (imports PIL)"""
+    global font, large_font
+    from PIL import ImageFont
+    font = ImageFont.load_default()
+    # Try to load a larger font - you might need to adjust the path based on your system
+    try:
+        large_font = ImageFont.truetype(LARGE_FONT_FILE, 16)
+    except IOError:
+        large_font = font  # Fallback to default if the font isn't available
 
 def save_calibration(scaling_factor):
     with open(CALIBRATION_FILE, 'w') as f:
@@ -64,39 +103,27 @@ def load_calibration():
     except (FileNotFoundError, json.JSONDecodeError):
         return None
 
-def get_color_name(hex_color):
-    """Get the color name from the Color API"""
-    try:
-        response = requests.get(f'https://www.thecolorapi.com/id?hex={hex_color[1:]}')
-        if response.status_code == 200:
-            return response.json()['name']['value']
-        return None
-    except:
-        return None
+# In offline-first mode, local names closer than this (delta E) are used without asking the API
+OFFLINE_MATCH_DISTANCE = 5.0
 
-def draw_bar(draw, y_position, value, label):
-    """Draw a progress bar at the given y position for the given value (0-255)"""
-    # Bar container coordinates
-    left_border = 19
-    right_border = 119  # 100 pixels wide plus left border
-    bar_height = 8
-    
-    # Draw container borders
-    draw.line([(left_border, y_position), (left_border, y_position + bar_height)], fill="white")  # Left border
-    draw.line([(right_border, y_position), (right_border, y_position + bar_height)], fill="white")  # Right border
-    
-    # Calculate fill width based on value
-    fill_width = int((value / 255.0) * 100)  # Scale value to 0-100 pixels
-    
-    # Draw the filled portion
-    if fill_width > 0:
-        draw.rectangle([
-            (left_border + 1, y_position),
-            (left_border + fill_width, y_position + bar_height)
-        ], fill="white")
-    
-    # Draw label
-    draw.text((0, y_position), label, font=font, fill="white")
+def get_online_color_name(hex_color):
+    """Get the color name from the cache, or from the Color API without blocking (None while pending)"""
+    name = color_cache.get(hex_color)
+    if name is not None:
+        return name
+    return color_resolver.get(hex_color)
+
+def get_color_name(hex_color):
+    """Get the color name using the source selected with --color-names"""
+    if args.color_names == 'online':
+        return get_online_color_name(hex_color)
+    name, distance = offline_namer.nearest(hex_color)
+    if args.color_names == 'offline-first' and distance > OFFLINE_MATCH_DISTANCE:
+        # The local match stands in until the API has named this very color
+        online_name = get_online_color_name(hex_color)
+        if online_name is not None:
+            return online_name
+    return name
 
 def calibrate_lrv():
     """
@@ -104,33 +131,32 @@ def calibrate_lrv():
     Returns the calibrated scaling factor.
     """
     scaling_factors = []
+    ring = SampleRing(CALIBRATION_READINGS)
     print("\nLRV Calibration Process")
     print("=======================")
     
     for sample_name, known_lrv in CALIBRATION_SAMPLES.items():
         input(f"\nPlace the {sample_name} sample under the sensor and press Enter...")
         
-        # Take multiple readings and average them for stability
-        readings = []
-        for _ in range(5):
+        # Take multiple readings and filter them for stability
+        ring.clear()
+        for _ in range(CALIBRATION_READINGS):
             raw_r, raw_g, raw_b, raw_c = bh1745.get_rgbc_raw()
-            if raw_c == 0:
-                continue
-                
-            r_norm = raw_r / raw_c
-            g_norm = raw_g / raw_c
-            b_norm = raw_b / raw_c
-            
-            # Calculate relative luminance
-            luminance = (0.2126 * r_norm) + (0.7152 * g_norm) + (0.0722 * b_norm)
-            readings.append(luminance)
+            if raw_c != 0:
+                ring.push(raw_r, raw_g, raw_b, raw_c)
             time.sleep(0.2)
         
-        if not readings:
+        if ring.count == 0:
             print(f"Failed to get valid readings for {sample_name}")
             continue
-            
-        avg_luminance = sum(readings) / len(readings)
+        
+        raw_r, raw_g, raw_b, raw_c = ring.filtered(TRIMMED)
+        r_norm = raw_r / raw_c
+        g_norm = raw_g / raw_c
+        b_norm = raw_b / raw_c
+        
+        # Calculate relative luminance
+        avg_luminance = (0.2126 * r_norm) + (0.7152 * g_norm) + (0.0722 * b_norm)
         
         # Calculate scaling factor needed to match known LRV
         if avg_luminance > 0:
@@ -148,56 +174,118 @@ def calibrate_lrv():
     print(f"\nFinal calibrated scaling factor: {final_scaling:.2f}")
     return final_scaling
 
-def get_corrected_rgb(raw_r, raw_g, raw_b, raw_c):
-    """Get RGB values corrected for sensor sensitivity"""
-    if raw_c == 0:
-        return (0, 0, 0)
-        
-    # Apply sensitivity corrections
-    r_corrected = raw_r / SENSITIVITY_CORRECTIONS['red']
-    g_corrected = raw_g / SENSITIVITY_CORRECTIONS['green']
-    b_corrected = raw_b / SENSITIVITY_CORRECTIONS['blue']
-    
-    # Normalize and scale to 0-255
-    max_val = max(r_corrected, g_corrected, b_corrected)
-    if max_val > 0:
-        scale = 255.0 / max_val
-        return (
-            min(255, int(r_corrected * scale)),
-            min(255, int(g_corrected * scale)),
-            min(255, int(b_corrected * scale))
-        )
-    return (0, 0, 0)
-
-def calculate_lrv(r, g, b, c, scaling_factor):
-    """
-    Calculate calibrated Light Reflectance Value (LRV)
-    
-    Using CIE luminance coefficients (Y from CIE XYZ) and sensor sensitivity corrections:
-    - Red contribution: 0.2126
-    - Green contribution: 0.7152
-    - Blue contribution: 0.0722
-    """
-    if c == 0:
-        return 0
-        
-    # Apply sensitivity corrections to raw values
-    r_corrected = r / SENSITIVITY_CORRECTIONS['red']
-    g_corrected = g / SENSITIVITY_CORRECTIONS['green']
-    b_corrected = b / SENSITIVITY_CORRECTIONS['blue']
-    
-    # Normalize using clear reading
-    r_norm = r_corrected / c
-    g_norm = g_corrected / c
-    b_norm = b_corrected / c
-    
-    # Calculate relative luminance using CIE coefficients
-    luminance = (0.2126 * r_norm) + (0.7152 * g_norm) + (0.0722 * b_norm)
-    
-    # Scale to 0-100 range using calibrated scaling factor
-    lrv = min(100, luminance * scaling_factor)
-    
-    return round(lrv, 1)
+def acquire():
+    """Acquisition stage: take one sample and return the filtered reading of the last --oversample samples"""
+    if args.oversample <= 1:
+        return Reading.from_sensor(bh1745)
+    sample_ring.push(*bh1745.get_rgbc_raw())
+    r, g, b, c = sample_ring.filtered(args.filter)
+    return Reading(r, g, b, c, time.time())
+
+def compute(reading):
+    """Compute stage: derive everything the outputs show from one reading"""
+    r, g, b = reading.corrected()
+    color_hex = f"#{r:02x}{g:02x}{b:02x}"
+    return Frame(
+        color_hex=color_hex,
+        color_name=get_color_name(color_hex),
+        lrv=reading.lrv(scaling_factor),
+        rgb=(r, g, b),
+        reading=reading
+    )
+
+def render_frame(frame):
+    """Draw a frame into the renderer's reused 1-bit image"""
+    return renderer.render(frame)
+
+def display(frame):
+    """Display stage: render the frame and push it to the OLED"""
+    if render_timer is None:
+        device.display(render_frame(frame))
+        return
+    start = time.perf_counter()
+    image = render_frame(frame)
+    rendered = time.perf_counter()
+    device.display(image)
+    render_timer.observe(rendered - start)
+    push_timer.observe(time.perf_counter() - rendered)
+
+def print_frame(frame):
+    """Console stage: print the frame for debugging"""
+    r, g, b = frame.rgb
+    raw_r, raw_g, raw_b, raw_c = frame.reading.raw
+    print(f"\033[2J\033[H")  # Clear console
+    print(f"Color: {frame.color_hex}")
+    if frame.color_name:
+        print(f"Name:  {frame.color_name}")
+    print("\nNormalized values:")
+    print(f"Red:   {r}")
+    print(f"Green: {g}")
+    print(f"Blue:  {b}")
+    print("\nRaw values:")
+    print(f"Red:   {raw_r}")
+    print(f"Green: {raw_g}")
+    print(f"Blue:  {raw_b}")
+    print(f"Clear: {raw_c}")
+    print(f"\nEstimated LRV: {frame.lrv}%")
+
+def publish(frame):
+    """Web stage: hand the frame to the web interface"""
+    from web_interface import update_data
+    r, g, b = frame.rgb
+    raw_r, raw_g, raw_b, raw_c = frame.reading.raw
+    update_data(
+        frame.color_hex,
+        frame.color_name,
+        frame.lrv,
+        {'r': r, 'g': g, 'b': b},
+        {'r': raw_r, 'g': raw_g, 'b': raw_b, 'c': raw_c}
+    )
+
+def record(frame):
+    """History stage: append the frame to the on-disk log"""
+    reading = frame.reading
+    history.append(reading.timestamp, reading.r, reading.g, reading.b, reading.c, frame.lrv)
+
+def instrument(registry, pipeline):
+    """Register the metrics of every subsystem and serve them at /metrics"""
+    global render_timer, push_timer
+    pipeline.instrument(registry)
+    render_timer = registry.histogram('lrv_render_seconds', 'Time spent drawing a frame with PIL')
+    push_timer = registry.histogram('lrv_display_push_seconds', 'Time spent sending a frame to the display')
+    compute_timer = next(stage.timer for stage in pipeline.stages if stage.name == 'compute')
+    registry.counter_func('lrv_frames_total', 'Frames computed from sensor readings',
+                          lambda: compute_timer.count)
+    if color_resolver is not None:
+        registry.counter_func('lrv_color_api_failures_total', 'Failed Color API requests',
+                              lambda: color_resolver.failures)
+        registry.gauge_func('lrv_color_api_circuit_open', 'Whether Color API requests are suspended after failures',
+                            lambda: int(color_resolver.breaker.state == 'open'))
+    if color_cache is not None:
+        registry.counter_func('lrv_color_cache_hits_total', 'Color names found in the cache',
+                              lambda: color_cache.hits)
+        registry.counter_func('lrv_color_cache_disk_hits_total', 'Cache hits that had to be loaded from disk',
+                              lambda: color_cache.disk_hits)
+        registry.counter_func('lrv_color_cache_misses_total', 'Color names not found in the cache',
+                              lambda: color_cache.misses)
+    if not args.no_web:
+        from web_interface import set_metrics
+        set_metrics(registry)
+
+def sample_rate(value):
+    """argparse type for --rate: a positive rate the BH1745 can keep up with"""
+    rate = float(value)
+    if not 0 < rate <= MAX_SAMPLE_RATE:
+        raise argparse.ArgumentTypeError(
+            f"must be between 0 and {MAX_SAMPLE_RATE:g} samples per second "
+            f"(the BH1745 needs at least {BH1745_MEASUREMENT_TIMES_MS[0]} ms per measurement)")
+    return rate
+
+def measurement_time_for_rate(rate):
+    """Longest BH1745 measurement time, up to the default, that fits in one sample period"""
+    fitting = [t for t in BH1745_MEASUREMENT_TIMES_MS
+               if t <= BH1745_DEFAULT_MEASUREMENT_MS and t <= 1000.0 / rate]
+    return fitting[-1]
 
 def parse_args():
     parser = argparse.ArgumentParser(description='LRV Measurement Tool')
@@ -205,26 +293,59 @@ def parse_args():
                        help='Force calibration even if existing calibration exists')
     parser.add_argument('--skip-calibration', '-s', action='store_true',
                        help='Skip calibration and use default scaling factor (100.0)')
+    parser.add_argument('--calibrate-only', action='store_true',
+                       help='Calibrate and exit, without setting up the display, color names or web interface')
     parser.add_argument('--no-web', action='store_true',
                        help='Disable web interface')
+    parser.add_argument('--name-tolerance', type=float, default=TOLERANCE,
+                       help=f'Color difference (delta E) within which a cached name is reused (default {TOLERANCE})')
+    parser.add_argument('--color-names', choices=['online', 'offline', 'offline-first'], default='online',
+                       help='Where color names come from: the Color API, the built-in color list, '
+                            'or the built-in list with the API for colors it has no close match for')
+    parser.add_argument('--rate', '--sensor-rate', type=sample_rate, default=1.0,
+                       help=f'Sensor samples per second, up to {MAX_SAMPLE_RATE:g} (default 1.0)')
+    parser.add_argument('--oversample', type=int, default=1,
+                       help='Filter each reading over this many of the latest samples (default 1, no filtering)')
+    parser.add_argument('--filter', choices=[MEAN, MEDIAN, TRIMMED], default=MEDIAN,
+                       help='Filter used with --oversample (default median)')
+    parser.add_argument('--history-dir', default=HISTORY_DIR,
+                       help=f'Directory for the reading history log (default {HISTORY_DIR})')
+    parser.add_argument('--no-history', action='store_true',
+                       help='Disable recording the reading history')
+    parser.add_argument('--sensor', choices=SENSORS, default='bh1745',
+                       help='Sensor backend: the BH1745, a simulated sensor, or a recorded trace (default bh1745)')
+    parser.add_argument('--replay-file',
+                       help='History log, directory of logs or CSV to play back with --sensor replay')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                       help='Playback speed for --sensor replay; 0 plays back as fast as possible (default 1.0)')
+    parser.add_argument('--sim-noise', type=float, default=0.01,
+                       help='Relative noise of --sensor sim readings (default 0.01)')
+    parser.add_argument('--display', choices=DISPLAYS, default='sh1106',
+                       help='Display backend: the SH1106 OLED, or a null/in-memory display (default sh1106)')
+    parser.add_argument('--display-rate', type=float, default=5.0,
+                       help='Maximum OLED refreshes per second (default 5.0)')
+    parser.add_argument('--console-rate', type=float, default=1.0,
+                       help='Maximum console updates per second (default 1.0)')
+    parser.add_argument('--web-rate', type=float, default=5.0,
+                       help='Maximum web interface updates per second (default 5.0)')
+    parser.add_argument('--metrics', action='store_true',
+                       help='Time every stage and serve Prometheus metrics at /metrics')
+    parser.add_argument('--startup-time', action='store_true',
+                       help='Start up, print how long each import and initialization step took, and exit')
     return parser.parse_args()
 
-args = parse_args()
+def calibrate():
+    """Set the scaling factor from the saved calibration, or by calibrating with the sensor"""
+    global scaling_factor
+    if args.skip_calibration:
+        print("Skipping calibration, using default scaling factor (100.0)")
+        scaling_factor = 100.0
+        return
 
-# Start web server if not disabled
-if not args.no_web:
-    print("Starting web interface on port 8080...")
-    web_thread = threading.Thread(target=start_server, daemon=True)
-    web_thread.start()
-
-if args.skip_calibration:
-    print("Skipping calibration, using default scaling factor (100.0)")
-    scaling_factor = 100.0
-else:
     print("Checking for existing calibration...")
     scaling_factor = load_calibration()
-    if scaling_factor is None or args.calibrate:
-        if args.calibrate:
+    if scaling_factor is None or args.calibrate or args.calibrate_only:
+        if args.calibrate or args.calibrate_only:
             print("Forced calibration requested...")
         else:
             print("No calibration found. Starting calibration process...")
@@ -240,77 +361,147 @@ else:
                 save_calibration(scaling_factor)
                 print("New calibration saved.")
 
-time.sleep(1.0)  # Skip the reading that happened before the LEDs were enabled
+def setup(startup, registry):
+    """Import and initialize the subsystems the arguments ask for, timing each step"""
+    global device, renderer, history, color_cache, color_resolver, offline_namer
 
-try:
-    while True:
-        # Create a new image with mode '1' for 1-bit color
-        image = Image.new('1', (device.width, device.height))
-        draw = ImageDraw.Draw(image)
-        
-        # Get both raw and scaled readings
-        raw_r, raw_g, raw_b, raw_c = bh1745.get_rgbc_raw()
-        r, g, b = get_corrected_rgb(raw_r, raw_g, raw_b, raw_c)
-        
-        color_hex = f"#{r:02x}{g:02x}{b:02x}"
-        
-        # Get color name
-        color_name = get_color_name(color_hex)
-        
-        # Draw the hex color value with larger font
-        draw.text((0, 0), color_hex, font=large_font, fill="white")
-        if color_name:
-            # Draw color name below hex value
-            draw.text((0, 20), color_name, font=font, fill="white")
-        
-        # Draw the bars
-        draw_bar(draw, 40, r, "R:")
-        draw_bar(draw, 55, g, "G:")
-        draw_bar(draw, 70, b, "B:")
-        
-        # Display the image on the OLED
-        device.display(image)
-        
-        # Print to console for debugging
-        print(f"\033[2J\033[H")  # Clear console
-        print(f"Color: {color_hex}")
-        if color_name:
-            print(f"Name:  {color_name}")
-        print("\nNormalized values:")
-        print(f"Red:   {r}")
-        print(f"Green: {g}")
-        print(f"Blue:  {b}")
-        print("\nRaw values:")
-        print(f"Red:   {raw_r}")
-        print(f"Green: {raw_g}")
-        print(f"Blue:  {raw_b}")
-        print(f"Clear: {raw_c}")
-        
-        raw_r, raw_g, raw_b, raw_c = bh1745.get_rgbc_raw()
-        lrv = calculate_lrv(raw_r, raw_g, raw_b, raw_c, scaling_factor)
-        
-        # Add LRV to display and console output
-        draw.text((0, 85), f"LRV: {lrv}%", font=font, fill="white")
-        
-        print(f"\nEstimated LRV: {lrv}%")
-        
-        time.sleep(1.0)  # Changed to 1 second update frequency
-
-        if not args.no_web:
-            update_data(
-                color_hex,
-                color_name,
-                lrv,
-                {'r': r, 'g': g, 'b': b},
-                {'r': raw_r, 'g': raw_g, 'b': raw_b, 'c': raw_c}
-            )
-
-except KeyboardInterrupt:
-    print("\nProgram terminated by user")
-    
-finally:
-    # Clean up resources
-    print("Cleaning up...")
+    with startup.step('display'):
+        device = create_display(args.display)
+    with startup.step('import PIL'):
+        from renderer import FrameRenderer
+    with startup.step('fonts'):
+        load_fonts()
+    with startup.step('renderer'):
+        renderer = FrameRenderer(device.width, device.height, font, large_font)
+
+    # Online color names come from a persistent cache, falling back to the Color
+    # API on a background thread so a slow network never stalls the loop
+    color_cache = color_resolver = offline_namer = None
+    if args.color_names != 'offline':
+        with startup.step('color name cache'):
+            color_cache = ColorNameCache(COLOR_CACHE_FILE, tolerance=args.name_tolerance)
+        with startup.step('import niquests'):
+            from color_resolver import ColorNameResolver
+        with startup.step('Color API resolver'):
+            color_resolver = ColorNameResolver(cache=color_cache, timer=registry and registry.histogram(
+                'lrv_color_api_seconds', 'Time spent in Color API requests'))
+    if args.color_names != 'online':
+        with startup.step('import offline color names'):
+            from color_offline import OfflineColorNamer
+        with startup.step('offline color names'):
+            offline_namer = OfflineColorNamer()
+
+    if not args.no_history:
+        with startup.step('history'):
+            history = HistoryStore(args.history_dir)
+
+    # Start web server if not disabled
+    if not args.no_web:
+        with startup.step('import Flask'):
+            from web_interface import start_server, set_history
+        with startup.step('web interface'):
+            if not args.no_history:
+                set_history(history)
+            if not args.startup_time:
+                print("Starting web interface on port 8080...")
+                web_thread = threading.Thread(target=start_server, daemon=True)
+                web_thread.start()
+
+def close():
+    """Release everything setup() and main() opened"""
+    if history is not None:
+        history.close()
+    if color_resolver is not None:
+        color_resolver.stop()
+    if color_cache is not None:
+        stats = color_cache.stats()
+        print(f"Color name cache: {stats['hits']} hits, {stats['misses']} misses")
+        color_cache.close()
     bh1745.set_leds(0)
-    device.cleanup()
-    print("Cleanup complete")
+    if device is not None:
+        device.cleanup()
+
+def main():
+    global args, bh1745, scaling_factor, sample_ring
+
+    args = parse_args()
+    startup = StartupTimer(IMPORT_START)
+
+    # Set up the sensor first: it is all calibration needs
+    with startup.step('sensor'):
+        bh1745 = create_sensor(args.sensor, args.replay_file, args.replay_speed, args.sim_noise)
+        bh1745.set_leds(1)
+        measurement_time_ms = measurement_time_for_rate(args.rate)
+        if measurement_time_ms != BH1745_DEFAULT_MEASUREMENT_MS:
+            bh1745.set_measurement_time_ms(measurement_time_ms)
+
+    if args.calibrate_only:
+        try:
+            calibrate()
+        finally:
+            bh1745.set_leds(0)
+        return
+
+    registry = Registry() if args.metrics else None
+    try:
+        setup(startup, registry)
+    except BaseException:
+        close()
+        raise
+    if args.startup_time:
+        startup.report()
+        close()
+        return
+
+    calibrate()
+
+    time.sleep(1.0)  # Skip the reading that happened before the LEDs were enabled
+
+    sample_ring = SampleRing(max(1, args.oversample))
+
+    # The loop runs as a pipeline: the sensor is sampled at its own rate and each
+    # output keeps only the newest frame, so a slow display or client drops stale
+    # frames instead of holding up the readings
+    sensor_queue = LatestValue()
+    render_queue = LatestValue()
+    console_queue = LatestValue()
+    web_queue = LatestValue()
+    # Every reading should reach the log, so give it room to catch up
+    history_queue = LatestValue(maxlen=256)
+
+    frame_queues = [render_queue, console_queue]
+    output_stages = [
+        Stage('display', display, source=render_queue, rate=args.display_rate),
+        Stage('console', print_frame, source=console_queue, rate=args.console_rate),
+    ]
+    if not args.no_web:
+        frame_queues.append(web_queue)
+        output_stages.append(Stage('web', publish, source=web_queue, rate=args.web_rate))
+    if not args.no_history:
+        frame_queues.append(history_queue)
+        output_stages.append(Stage('history', record, source=history_queue))
+    stages = [
+        Stage('sensor', acquire, outputs=[sensor_queue], rate=args.rate),
+        Stage('compute', compute, source=sensor_queue, outputs=frame_queues),
+    ] + output_stages
+    pipeline = Pipeline(stages)
+    if registry is not None:
+        instrument(registry, pipeline)
+
+    try:
+        pipeline.start()
+        pipeline.wait()
+
+    except KeyboardInterrupt:
+        print("\nProgram terminated by user")
+    
+    finally:
+        # Clean up resources
+        print("Cleaning up...")
+        pipeline.stop()
+        pipeline.report()
+        close()
+        print("Cleanup complete")
+
+if __name__ == '__main__':
+    main()
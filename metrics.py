@@ -0,0 +1,146 @@
+import threading
+from bisect import bisect_left
+
+# Latency histogram buckets in seconds, from 100 µs to 10 s
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=None):
+    items = list(labels.items())
+    if extra is not None:
+        items.append(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in items) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A value that only goes up"""
+
+    type = 'counter'
+
+    def __init__(self, labels):
+        self.labels = labels
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name):
+        yield name + _format_labels(self.labels), self.value
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed buckets.
+
+    Counts are kept per bucket and only made cumulative when rendered,
+    so observe() is a bisect and two additions.
+    """
+
+    type = 'histogram'
+
+    def __init__(self, labels, buckets=LATENCY_BUCKETS):
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+
+    def samples(self, name):
+        with self._lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float('inf'),), counts):
+            cumulative += n
+            yield name + '_bucket' + _format_labels(self.labels, ('le', _format_value(bound))), cumulative
+        yield name + '_sum' + _format_labels(self.labels), total
+        yield name + '_count' + _format_labels(self.labels), count
+
+
+class Callback:
+    """A counter or gauge whose value is read from func() when scraped"""
+
+    def __init__(self, type, labels, func):
+        self.type = type
+        self.labels = labels
+        self.func = func
+
+    def samples(self, name):
+        yield name + _format_labels(self.labels), self.func()
+
+
+class Registry:
+    """
+    Named metrics rendered in the Prometheus text format.
+
+    Metrics are created once, up front; the hot path only touches the
+    Counter or Histogram objects handed out here. Values that already
+    exist elsewhere (queue drops, cache hits) are registered as callbacks
+    and read at scrape time instead of being counted twice.
+    """
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name, help, labels, create):
+        key = tuple(sorted((labels or {}).items()))
+        with self._lock:
+            family = self._families.setdefault(name, {'help': help, 'type': None, 'metrics': {}})
+            metric = family['metrics'].get(key)
+            if metric is None:
+                metric = create(dict(labels or {}))
+                if family['type'] not in (None, metric.type):
+                    raise ValueError(f"metric {name} registered as both {family['type']} and {metric.type}")
+                family['type'] = metric.type
+                family['metrics'][key] = metric
+            return metric
+
+    def counter(self, name, help, labels=None):
+        return self._get(name, help, labels, Counter)
+
+    def histogram(self, name, help, labels=None, buckets=LATENCY_BUCKETS):
+        return self._get(name, help, labels, lambda labels: Histogram(labels, buckets))
+
+    def counter_func(self, name, help, func, labels=None):
+        return self._get(name, help, labels, lambda labels: Callback('counter', labels, func))
+
+    def gauge_func(self, name, help, func, labels=None):
+        return self._get(name, help, labels, lambda labels: Callback('gauge', labels, func))
+
+    def render(self):
+        with self._lock:
+            families = [(name, dict(family)) for name, family in self._families.items()]
+        lines = []
+        for name, family in families:
+            lines.append(f"# HELP {name} {family['help']}")
+            lines.append(f"# TYPE {name} {family['type']}")
+            for metric in list(family['metrics'].values()):
+                for sample, value in metric.samples(name):
+                    lines.append(f"{sample} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,152 @@
+import threading
+import time
+from time import perf_counter
+import traceback
+from collections import deque
+from scheduler import RateScheduler
+
+
+class LatestValue:
+    """
+    Bounded queue between two stages.
+
+    Holds at most `maxlen` items; putting into a full queue drops the
+    oldest item, so a slow consumer always sees the freshest data instead
+    of holding up the producer.
+    """
+
+    def __init__(self, maxlen=1):
+        self._items = deque(maxlen=maxlen)
+        self._condition = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        with self._condition:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """Return the oldest queued item, or None if nothing arrived within timeout"""
+        with self._condition:
+            if not self._items:
+                self._condition.wait(timeout)
+                if not self._items:
+                    return None
+            return self._items.popleft()
+
+
+class Stage:
+    """
+    One step of the measurement pipeline, run on its own thread.
+
+    A stage without a source calls func() to produce items (e.g. reading
+    the sensor); otherwise it calls func(item) for every item taken from
+    the source. Non-None results are put into every output queue. `rate`
+    sets how often func runs, in calls per second, on fixed deadlines.
+    When `timer` is set to a metrics Histogram, every call of func is
+    timed into it.
+    """
+
+    def __init__(self, name, func, source=None, outputs=(), rate=None):
+        self.name = name
+        self.func = func
+        self.source = source
+        self.outputs = list(outputs)
+        self.scheduler = RateScheduler(rate) if rate else None
+        self.timer = None
+        self.error = None
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    @property
+    def alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        scheduler = self.scheduler
+        timer = self.timer
+        try:
+            if scheduler is not None:
+                scheduler.start()
+            while self._running:
+                if self.source is None:
+                    if timer is None:
+                        result = self.func()
+                    else:
+                        start = perf_counter()
+                        result = self.func()
+                        timer.observe(perf_counter() - start)
+                else:
+                    item = self.source.get(timeout=0.1)
+                    if item is None:
+                        continue
+                    if scheduler is not None:
+                        # Time spent waiting for input is not an overrun
+                        scheduler.resync()
+                    if timer is None:
+                        result = self.func(item)
+                    else:
+                        start = perf_counter()
+                        result = self.func(item)
+                        timer.observe(perf_counter() - start)
+                if result is not None:
+                    for output in self.outputs:
+                        output.put(result)
+                if scheduler is not None:
+                    scheduler.wait()
+        except Exception as e:
+            self.error = e
+            traceback.print_exc()
+
+
+class Pipeline:
+    """A set of stages started and stopped together"""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self):
+        for stage in self.stages:
+            stage.stop()
+
+    def instrument(self, registry):
+        """Time every stage and count the items its input queue dropped; call before start()"""
+        for stage in self.stages:
+            stage.timer = registry.histogram(
+                'lrv_stage_seconds', 'Time spent in each pipeline stage per item',
+                {'stage': stage.name})
+            if stage.source is not None:
+                registry.counter_func(
+                    'lrv_dropped_frames_total', 'Items replaced in a stage input queue before the stage took them',
+                    lambda source=stage.source: source.dropped, {'stage': stage.name})
+
+    def report(self):
+        """Print the timing of every rate-limited stage"""
+        for stage in self.stages:
+            if stage.scheduler is not None:
+                print(f"{stage.name}: {stage.scheduler.summary()}")
+
+    def wait(self, poll=0.5):
+        """Block until a stage fails; re-raise its error in the caller"""
+        while True:
+            for stage in self.stages:
+                if stage.error is not None:
+                    raise RuntimeError(f"{stage.name} stage failed") from stage.error
+            time.sleep(poll)
@@ -0,0 +1,98 @@
+import time
+from collections import namedtuple
+
+# Approximate peak sensitivity ratios from the graph
+SENSITIVITY_CORRECTIONS = {
+    'red': 0.7,    # Peak around 615nm with ~0.7 relative sensitivity
+    'green': 1.0,  # Peak around 540nm with ~1.0 relative sensitivity
+    'blue': 0.55   # Peak around 465nm with ~0.55 relative sensitivity
+}
+
+def get_corrected_rgb(raw_r, raw_g, raw_b, raw_c):
+    """Get RGB values corrected for sensor sensitivity"""
+    if raw_c == 0:
+        return (0, 0, 0)
+        
+    # Apply sensitivity corrections
+    r_corrected = raw_r / SENSITIVITY_CORRECTIONS['red']
+    g_corrected = raw_g / SENSITIVITY_CORRECTIONS['green']
+    b_corrected = raw_b / SENSITIVITY_CORRECTIONS['blue']
+    
+    # Normalize and scale to 0-255
+    max_val = max(r_corrected, g_corrected, b_corrected)
+    if max_val > 0:
+        scale = 255.0 / max_val
+        return (
+            min(255, int(r_corrected * scale)),
+            min(255, int(g_corrected * scale)),
+            min(255, int(b_corrected * scale))
+        )
+    return (0, 0, 0)
+
+def calculate_lrv(r, g, b, c, scaling_factor):
+    """
+    Calculate calibrated Light Reflectance Value (LRV)
+    
+    Using CIE luminance coefficients (Y from CIE XYZ) and sensor sensitivity corrections:
+    - Red contribution: 0.2126
+    - Green contribution: 0.7152
+    - Blue contribution: 0.0722
+    """
+    if c == 0:
+        return 0
+        
+    # Apply sensitivity corrections to raw values
+    r_corrected = r / SENSITIVITY_CORRECTIONS['red']
+    g_corrected = g / SENSITIVITY_CORRECTIONS['green']
+    b_corrected = b / SENSITIVITY_CORRECTIONS['blue']
+    
+    # Normalize using clear reading
+    r_norm = r_corrected / c
+    g_norm = g_corrected / c
+    b_norm = b_corrected / c
+    
+    # Calculate relative luminance using CIE coefficients
+    luminance = (0.2126 * r_norm) + (0.7152 * g_norm) + (0.0722 * b_norm)
+    
+    # Scale to 0-100 range using calibrated scaling factor
+    lrv = min(100, luminance * scaling_factor)
+    
+    return round(lrv, 1)
+
+class Reading(namedtuple('Reading', ['r', 'g', 'b', 'c', 'timestamp'])):
+    """
+    One raw RGBC sample from the BH1745, taken in a single bus transaction.
+
+    The other views of the sample are computed from it in software, so
+    the hex, the bars and the LRV all describe the same measurement.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_sensor(cls, sensor):
+        r, g, b, c = sensor.get_rgbc_raw()
+        return cls(r, g, b, c, time.time())
+
+    @property
+    def raw(self):
+        return (self.r, self.g, self.b, self.c)
+
+    def clamped(self):
+        """RGB scaled so the brightest channel is 255 (as BH1745.get_rgb_clamped)"""
+        div = max(self.r, self.g, self.b)
+        if div > 0:
+            return tuple(int((x / float(div)) * 255) for x in (self.r, self.g, self.b))
+        return (0, 0, 0)
+
+    def scaled(self):
+        """RGB relative to the clear channel, 0-255 (as BH1745.get_rgb_scaled)"""
+        if self.c > 0:
+            return tuple(min(255, int((x / float(self.c)) * 255)) for x in (self.r, self.g, self.b))
+        return (0, 0, 0)
+
+    def corrected(self):
+        """RGB corrected for sensor sensitivity, 0-255"""
+        return get_corrected_rgb(self.r, self.g, self.b, self.c)
+
+    def lrv(self, scaling_factor):
+        return calculate_lrv(self.r, self.g, self.b, self.c, scaling_factor)
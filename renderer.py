@@ -0,0 +1,182 @@
+from collections import OrderedDict
+from PIL import Image, ImageDraw
+
+# Layout of the OLED frame: y positions of each line and bar
+HEX_Y = 0
+NAME_Y = 20
+BAR_YS = (40, 55, 70)
+BAR_LABELS = ("R:", "G:", "B:")
+LRV_Y = 85
+LRV_LABEL = "LRV: "
+
+# Bar container: 100 pixels wide between the two borders
+BAR_LEFT = 19
+BAR_RIGHT = 119
+BAR_HEIGHT = 8
+
+# Rendered color names kept for reuse
+NAME_CACHE_SIZE = 64
+
+
+def bar_width(value):
+    """Filled width in pixels of a bar for value (0-255)"""
+    return int((value / 255.0) * 100)
+
+
+def draw_bar(draw, y_position, value, label, font):
+    """Draw a progress bar at the given y position for the given value (0-255)"""
+    # Draw container borders
+    draw.line([(BAR_LEFT, y_position), (BAR_LEFT, y_position + BAR_HEIGHT)], fill="white")
+    draw.line([(BAR_RIGHT, y_position), (BAR_RIGHT, y_position + BAR_HEIGHT)], fill="white")
+
+    # Draw the filled portion
+    fill_width = bar_width(value)
+    if fill_width > 0:
+        draw.rectangle([
+            (BAR_LEFT + 1, y_position),
+            (BAR_LEFT + fill_width, y_position + BAR_HEIGHT)
+        ], fill="white")
+
+    # Draw label
+    draw.text((0, y_position), label, font=font, fill="white")
+
+
+class GlyphCache:
+    """
+    One-bit bitmaps of single characters of a font.
+
+    Text made of cached glyphs is pasted together without going through
+    FreeType, pixel for pixel the same as ImageDraw.text() in mode '1':
+    glyphs are placed at the pen position using the font's mode '1'
+    advances and pair kerning.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self._glyphs = {}
+        self._kerning = {}
+
+    def glyph(self, char):
+        entry = self._glyphs.get(char)
+        if entry is None:
+            font = self.font
+            mask, offset = font.getmask2(char, mode='1')
+            image = Image.new('1', mask.size)
+            ImageDraw.Draw(image).text((-offset[0], -offset[1]), char, font=font, fill="white")
+            entry = self._glyphs[char] = (image, offset, font.getlength(char, mode='1'))
+        return entry
+
+    def kerning(self, left, right):
+        pair = left + right
+        kern = self._kerning.get(pair)
+        if kern is None:
+            font = self.font
+            kern = self._kerning[pair] = (font.getlength(pair, mode='1')
+                                         - font.getlength(left, mode='1')
+                                         - font.getlength(right, mode='1'))
+        return kern
+
+    def draw(self, image, xy, text):
+        x, y = xy
+        pen = 0.0
+        previous = None
+        for char in text:
+            if previous is not None:
+                pen += self.kerning(previous, char)
+            glyph, (dx, dy), advance = self.glyph(char)
+            image.paste(1, (x + int(pen) + dx, y + dy), mask=glyph)
+            pen += advance
+            previous = char
+
+
+class FrameRenderer:
+    """
+    Renders frames into one reused 1-bit image.
+
+    The static parts (bar borders and labels) are drawn once into a
+    background. For each frame only the regions whose content changed
+    are restored from the background and redrawn: the hex value and LRV
+    from cached glyphs, the color name from a small cache of rendered
+    names, and the bars as plain rectangles. render() returns the same
+    image every time, so it must be consumed before the next call.
+    """
+
+    def __init__(self, width, height, font, large_font):
+        self.font = font
+        self.image = Image.new('1', (width, height))
+        self.draw = ImageDraw.Draw(self.image)
+        self.large_glyphs = GlyphCache(large_font)
+        self.glyphs = GlyphCache(font)
+        self._names = OrderedDict()
+
+        self.background = Image.new('1', (width, height))
+        draw = ImageDraw.Draw(self.background)
+        for y, label in zip(BAR_YS, BAR_LABELS):
+            draw_bar(draw, y, 0, label, font)
+        draw.text((0, LRV_Y), LRV_LABEL, font=font, fill="white")
+
+        # Region boxes; each ends where the next line starts
+        self.hex_box = (0, HEX_Y, width, NAME_Y)
+        self.name_box = (0, NAME_Y, width, BAR_YS[0])
+        self.bar_boxes = [(BAR_LEFT + 1, y, BAR_RIGHT + 1, y + BAR_HEIGHT + 1) for y in BAR_YS]
+        self.lrv_x = int(font.getlength(LRV_LABEL, mode='1'))
+        self.lrv_box = (self.lrv_x, LRV_Y, width, height)
+        self._background_regions = {}
+        self.invalidate()
+
+    def invalidate(self):
+        """Redraw everything on the next render()"""
+        self.image.paste(self.background)
+        self._hex = self._name = self._lrv = None
+        self._bars = [0] * len(BAR_YS)
+
+    def _restore(self, box):
+        region = self._background_regions.get(box)
+        if region is None:
+            region = self._background_regions[box] = self.background.crop(box)
+        self.image.paste(region, box)
+
+    def _name_image(self, name):
+        image = self._names.get(name)
+        if image is None:
+            left, top, right, bottom = self.name_box
+            image = Image.new('1', (right - left, bottom - top))
+            ImageDraw.Draw(image).text((0, 0), name, font=self.font, fill="white")
+            self._names[name] = image
+            if len(self._names) > NAME_CACHE_SIZE:
+                self._names.popitem(last=False)
+        else:
+            self._names.move_to_end(name)
+        return image
+
+    def render(self, frame):
+        image = self.image
+
+        if frame.color_hex != self._hex:
+            self._hex = frame.color_hex
+            self._restore(self.hex_box)
+            self.large_glyphs.draw(image, (0, HEX_Y), frame.color_hex)
+
+        if frame.color_name != self._name:
+            self._name = frame.color_name
+            self._restore(self.name_box)
+            if frame.color_name:
+                image.paste(self._name_image(frame.color_name), self.name_box[:2])
+
+        for i, value in enumerate(frame.rgb):
+            width = bar_width(value)
+            if width != self._bars[i]:
+                self._bars[i] = width
+                box = self.bar_boxes[i]
+                self._restore(box)
+                if width > 0:
+                    self.draw.rectangle([(BAR_LEFT + 1, box[1]), (BAR_LEFT + width, box[1] + BAR_HEIGHT)],
+                                        fill="white")
+
+        lrv = f"{frame.lrv}%"
+        if lrv != self._lrv:
+            self._lrv = lrv
+            self._restore(self.lrv_box)
+            self.glyphs.draw(image, (self.lrv_x, LRV_Y), lrv)
+
+        return image
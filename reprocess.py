@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from multiprocessing import Pool
+
+import numpy as np
+
+from color_offline import OfflineColorNamer
+from history import RECORD_SIZE, SEGMENT_SUFFIX
+from lrv_batch import calculate_lrv_batch, get_corrected_rgb_batch
+from reading import SENSITIVITY_CORRECTIONS
+
+# Records per chunk handed to a worker
+CHUNK_RECORDS = 65536
+
+# numpy view of history.RECORD
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('r', '<u2'), ('g', '<u2'), ('b', '<u2'), ('c', '<u2'),
+    ('lrv', '<f4')
+])
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+
+CSV_HEADER = ['timestamp', 'raw_r', 'raw_g', 'raw_b', 'raw_c',
+              'lrv', 'color_hex', 'color_name', 'recorded_lrv']
+
+# Offline namer of each worker process, created on first use
+namer = None
+
+
+def process_chunk(task):
+    """Recompute one chunk of a history log and return it as CSV text"""
+    global namer
+    path, offset, count, scaling_factor, corrections = task
+    if namer is None:
+        namer = OfflineColorNamer()
+
+    records = np.fromfile(path, dtype=RECORD_DTYPE, count=count, offset=offset * RECORD_SIZE)
+    rgbc = np.stack([records['r'], records['g'], records['b'], records['c']], axis=1)
+    lrv = calculate_lrv_batch(rgbc, scaling_factor, corrections)
+    rgb = get_corrected_rgb_batch(rgbc, corrections)
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    for record, value, (r, g, b) in zip(records.tolist(), lrv.tolist(), rgb.tolist()):
+        timestamp, raw_r, raw_g, raw_b, raw_c, recorded = record
+        color_hex = f"#{r:02x}{g:02x}{b:02x}"
+        writer.writerow([timestamp, raw_r, raw_g, raw_b, raw_c, value,
+                         color_hex, namer.name(color_hex), round(recorded, 1)])
+    return out.getvalue()
+
+
+def log_files(paths):
+    """Expand directories into their history segments, in recording order"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(SEGMENT_SUFFIX):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def chunk_tasks(paths, scaling_factor, corrections, chunk_records):
+    for path in log_files(paths):
+        count = os.path.getsize(path) // RECORD_SIZE
+        for offset in range(0, count, chunk_records):
+            yield (path, offset, min(chunk_records, count - offset), scaling_factor, corrections)
+
+
+def bounded_imap(pool, func, tasks, window):
+    """
+    Like Pool.imap, but with at most `window` chunks queued or finished and
+    not yet consumed, so memory stays constant however long the input is.
+    """
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def load_scaling_factor(path):
+    with open(path, 'r') as f:
+        return json.load(f)['scaling_factor']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Recompute LRV, color and color name for recorded history logs')
+    parser.add_argument('inputs', nargs='+',
+                        help='History log files or directories of them')
+    parser.add_argument('--output', '-o', default='-',
+                        help='CSV file to write (default: standard output)')
+    scaling = parser.add_mutually_exclusive_group()
+    scaling.add_argument('--scaling-factor', type=float,
+                         help='Calibration scaling factor to apply')
+    scaling.add_argument('--calibration', default='lrv_calibration.json',
+                         help='Calibration file to take the scaling factor from (default lrv_calibration.json)')
+    parser.add_argument('--red', type=float, default=SENSITIVITY_CORRECTIONS['red'],
+                        help='Red sensitivity correction')
+    parser.add_argument('--green', type=float, default=SENSITIVITY_CORRECTIONS['green'],
+                        help='Green sensitivity correction')
+    parser.add_argument('--blue', type=float, default=SENSITIVITY_CORRECTIONS['blue'],
+                        help='Blue sensitivity correction')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_RECORDS,
+                        help=f'Records per chunk (default {CHUNK_RECORDS})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Worker processes (default: one per CPU)')
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error(f"--workers must be at least 1, got {args.workers}")
+    if args.scaling_factor is None:
+        try:
+            args.scaling_factor = load_scaling_factor(args.calibration)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"no scaling factor in {args.calibration} ({e}); "
+                         f"give one with --scaling-factor or a calibration file with --calibration")
+    return args
+
+
+def main():
+    args = parse_args()
+    scaling_factor = args.scaling_factor
+    corrections = {'red': args.red, 'green': args.green, 'blue': args.blue}
+    tasks = chunk_tasks(args.inputs, scaling_factor, corrections, args.chunk_size)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        csv.writer(output).writerow(CSV_HEADER)
+        with Pool(args.workers) as pool:
+            for text in bounded_imap(pool, process_chunk, tasks, 2 * args.workers):
+                output.write(text)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
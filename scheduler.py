@@ -0,0 +1,63 @@
+import time
+
+
+class RateScheduler:
+    """
+    Keep a loop running at a fixed rate.
+
+    Deadlines advance by exactly one period from a monotonic clock, so
+    the time spent doing the work doesn't add to the period and the loop
+    doesn't drift. When the work overruns a deadline the missed periods
+    are skipped (counted in `overruns`) instead of running back-to-back.
+    Jitter is how late the loop woke up relative to its deadline.
+    """
+
+    def __init__(self, rate, clock=time.monotonic, sleep=time.sleep):
+        self.period = 1.0 / rate
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = None
+        self.ticks = 0
+        self.overruns = 0
+        self.jitter_total = 0.0
+        self.jitter_max = 0.0
+
+    def start(self):
+        self.deadline = self.clock() + self.period
+
+    def resync(self):
+        """Start a new period now if the deadline has passed while idle, without counting an overrun"""
+        now = self.clock()
+        if self.deadline is None or self.deadline < now:
+            self.deadline = now + self.period
+
+    def wait(self):
+        """Sleep until the next deadline"""
+        if self.deadline is None:
+            self.start()
+        now = self.clock()
+        if now > self.deadline:
+            missed = int((now - self.deadline) / self.period) + 1
+            self.overruns += missed
+            self.deadline += missed * self.period
+        self.sleep(self.deadline - now)
+
+        jitter = self.clock() - self.deadline
+        self.ticks += 1
+        self.jitter_total += jitter
+        if jitter > self.jitter_max:
+            self.jitter_max = jitter
+        self.deadline += self.period
+
+    def stats(self):
+        return {
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'jitter_mean_ms': self.jitter_total / self.ticks * 1000 if self.ticks else 0.0,
+            'jitter_max_ms': self.jitter_max * 1000
+        }
+
+    def summary(self):
+        stats = self.stats()
+        return (f"{stats['ticks']} ticks at {1 / self.period:g} Hz, {stats['overruns']} overruns, "
+                f"jitter mean {stats['jitter_mean_ms']:.2f} ms / max {stats['jitter_max_ms']:.2f} ms")
@@ -0,0 +1,30 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIRMWARE_DIR = os.path.join(ROOT, 'LR')
+
+# Host modules first: LR/ has its own lrv.py, imported by the firmware tests
+# under another name
+sys.path.insert(0, ROOT)
+sys.path.append(FIRMWARE_DIR)
+
+
+@pytest.fixture(scope='session')
+def firmware_shims():
+    """The fakes of the Pico's modules from LR/shims, installed"""
+    import shims
+    shims.install()
+    return shims
+
+
+@pytest.fixture(scope='session')
+def firmware(firmware_shims):
+    """LR/lrv.py, imported as `firmware_lrv` so it doesn't shadow the host lrv.py"""
+    spec = importlib.util.spec_from_file_location('firmware_lrv', os.path.join(FIRMWARE_DIR, 'lrv.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
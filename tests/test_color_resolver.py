@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from color_resolver import ColorNameResolver
+
+
+class ColorAPIStandIn:
+    """Local HTTP server answering like the Color API, with names 'N<hex>'"""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+        # Seconds between body bytes, to send a slowly trickling response
+        self.trickle = 0
+        # Cleared to hold requests in flight
+        self.gate = threading.Event()
+        self.gate.set()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hex_value = parse_qs(urlparse(self.path).query)['hex'][0]
+                stand_in.requests.append(hex_value)
+                stand_in.gate.wait(5.0)
+                body = json.dumps({'name': {'value': 'N' + hex_value}}).encode()
+                self.send_response(stand_in.status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if not stand_in.trickle:
+                    self.wfile.write(body)
+                    return
+                for i in range(len(body)):
+                    self.wfile.write(body[i:i + 1])
+                    self.wfile.flush()
+                    time.sleep(stand_in.trickle)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/id'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.gate.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def api():
+    stand_in = ColorAPIStandIn()
+    yield stand_in
+    stand_in.close()
+
+
+@pytest.fixture
+def make_resolver(api):
+    resolvers = []
+
+    def make(**kwargs):
+        resolver = ColorNameResolver(base_url=api.url, **kwargs)
+        resolvers.append(resolver)
+        return resolver
+
+    yield make
+    for resolver in resolvers:
+        resolver.stop()
+
+
+def test_get_never_returns_the_name_of_another_hex(api, make_resolver):
+    resolver = make_resolver()
+    wait_for(lambda: resolver.get('#112233') == 'N112233')
+
+    api.gate.clear()
+    assert resolver.get('#445566') is None
+    wait_for(lambda: api.requests[-1:] == ['445566'])
+    assert resolver.get('#445566') is None
+    api.gate.set()
+    wait_for(lambda: resolver.get('#445566') == 'N445566')
+    assert resolver.get('#112233') is None
+
+
+def test_lookups_are_coalesced(api, make_resolver):
+    resolver = make_resolver()
+    api.gate.clear()
+    for _ in range(5):
+        resolver.get('#112233')
+    wait_for(lambda: api.requests == ['112233'])
+    # Only the newest of the colors submitted meanwhile is looked up, once
+    for hex_color in ('#445566', '#778899'):
+        for _ in range(5):
+            resolver.get(hex_color)
+            resolver.get('#112233')
+    api.gate.set()
+    wait_for(lambda: resolver.get('#778899') == 'N778899')
+    assert api.requests == ['112233', '778899']
+
+
+def test_circuit_breaker_opens_and_half_opens(api, make_resolver):
+    resolver = make_resolver(failure_threshold=2, reset_timeout=0.3)
+    api.status = 500
+    for i, hex_color in enumerate(('#000001', '#000002')):
+        resolver.get(hex_color)
+        wait_for(lambda: resolver.failures == i + 1)
+    assert resolver.breaker.state == 'open'
+
+    # While open, nothing goes out
+    resolver.get('#000003')
+    time.sleep(0.1)
+    assert api.requests == ['000001', '000002']
+
+    api.status = 200
+    wait_for(lambda: resolver.breaker.state == 'half-open')
+    wait_for(lambda: resolver.get('#000004') == 'N000004')
+    assert api.requests == ['000001', '000002', '000004']
+    assert resolver.breaker.state == 'closed'
+
+
+def test_lookup_is_cut_off_at_the_deadline(api, make_resolver):
+    resolver = make_resolver(deadline=0.5)
+    # Each byte arrives well within the socket read timeout
+    api.trickle = 0.2
+    start = time.monotonic()
+    resolver.get('#112233')
+    wait_for(lambda: resolver.failures == 1)
+    assert time.monotonic() - start < 1.5
+
+    api.trickle = 0
+    wait_for(lambda: resolver.get('#445566') == 'N445566')
@@ -0,0 +1,44 @@
+import random
+from fractions import Fraction
+
+
+def float_lrv(r, g, b, c):
+    """The firmware's LRV before it moved to integer math"""
+    if c == 0:
+        return 0
+    luminance = (0.2126 * (r / 0.7 / c)) + (0.7152 * (g / 1.0 / c)) + (0.0722 * (b / 0.55 / c))
+    return round(min(100, luminance * 100), 1)
+
+
+def exact_tenths(firmware, r, g, b, c):
+    if c == 0:
+        return 0
+    tenths = Fraction(firmware.LRV_WEIGHT_R * r + firmware.LRV_WEIGHT_G * g + firmware.LRV_WEIGHT_B * b,
+                      firmware.LRV_WEIGHT_DEN * c) * 1000
+    return 1000 if tenths >= 1000 else int(tenths + Fraction(1, 2))
+
+
+def readings():
+    rng = random.Random(5)
+    for _ in range(50000):
+        c = rng.choice([rng.randrange(1, 65536), rng.randrange(1, 300), 65535, 1, 0])
+        yield tuple(min(65535, int(c * rng.random() * rng.choice([0.5, 1, 1.5, 10]))) for _ in range(3)) + (c,)
+    for r in (0, 1, 65535):
+        for g in (0, 1, 65535):
+            for b in (0, 1, 65535):
+                for c in (0, 1, 2, 3, 65534, 65535):
+                    yield r, g, b, c
+
+
+def test_integer_lrv_is_exact(firmware):
+    for r, g, b, c in readings():
+        assert firmware.calculate_lrv_tenths(r, g, b, c) == exact_tenths(firmware, r, g, b, c), (r, g, b, c)
+
+
+def test_integer_lrv_matches_the_float_version(firmware):
+    for r, g, b, c in readings():
+        assert firmware.calculate_lrv(r, g, b, c) == float_lrv(r, g, b, c), (r, g, b, c)
+
+
+def test_format_tenths(firmware):
+    assert [firmware.format_tenths(t) for t in (0, 5, 456, 1000)] == ['0.0', '0.5', '45.6', '100.0']
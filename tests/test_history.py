@@ -0,0 +1,41 @@
+from history import HistoryStore
+
+
+def test_query_finds_records_after_the_clock_steps_back(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    for t in (1000.0, 1001.0, 1002.0):
+        store.append(t, 1, 2, 3, 4, 50.0)
+    # NTP sets the clock back after boot
+    for t in (500.0, 501.0, 502.0):
+        store.append(t, 1, 2, 3, 4, 60.0)
+    store.append(1003.0, 1, 2, 3, 4, 70.0)
+    store.close()
+
+    store = HistoryStore(str(tmp_path))
+    store.append(600.0, 1, 2, 3, 4, 80.0)
+    assert len(store.segment_paths()) == 3
+
+    count, records = store.query(500.0, 502.0)
+    assert [r[0] for r in records] == [500.0, 501.0]
+    count, records = store.query(1001.0, 1004.0)
+    assert [r[0] for r in records] == [1001.0, 1002.0, 1003.0]
+    count, records = store.query(0, 2000)
+    assert count == 8
+    store.close()
+
+
+def test_downsampled_query_stays_within_max_points(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    # Each clock step starts a new segment, so buckets span segment boundaries
+    for segment in range(5):
+        for i in range(3):
+            store.append(100.0 * (5 - segment) + i, 1, 2, 3, 4, float(10 * segment + i))
+    assert len(store.segment_paths()) == 5
+
+    count, records = store.query(0, 1e9, 7)
+    assert count == 15
+    assert 0 < len(records) <= 7
+    lrvs = [r[5] for r in records]
+    assert min(lrvs) == 0.0
+    assert max(lrvs) == 42.0
+    store.close()
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from lrv_batch import calculate_lrv_batch, get_corrected_rgb_batch
+from reading import calculate_lrv, get_corrected_rgb
+
+
+def readings():
+    rng = np.random.default_rng(12)
+    full_range = rng.integers(0, 65536, size=(100000, 4))
+    # Small values land on rounding ties far more often
+    small = rng.integers(0, 24, size=(50000, 4))
+    dark = np.array([[5, 7, 3, 0], [0, 0, 0, 0], [0, 0, 0, 9], [65535, 65535, 65535, 1]])
+    return np.concatenate([full_range, small, dark])
+
+
+@pytest.mark.parametrize('scaling_factor', [100.0, 123.81712196812845, 87.5])
+def test_lrv_matches_the_scalar_version_bit_for_bit(scaling_factor):
+    rgbc = readings()
+    expected = [calculate_lrv(r, g, b, c, scaling_factor) for r, g, b, c in rgbc.tolist()]
+    assert calculate_lrv_batch(rgbc, scaling_factor).tolist() == expected
+
+
+def test_corrected_rgb_matches_the_scalar_version():
+    rgbc = readings()
+    expected = [list(get_corrected_rgb(r, g, b, c)) for r, g, b, c in rgbc.tolist()]
+    assert get_corrected_rgb_batch(rgbc).tolist() == expected
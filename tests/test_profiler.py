@@ -0,0 +1,22 @@
+import time
+
+
+def run_loops(profiler, n, seconds):
+    for _ in range(n):
+        profiler.begin()
+        time.sleep(seconds)
+        profiler.lap(0)
+        profiler.end()
+
+
+def test_percentiles_cover_only_the_loops_since_the_last_report(firmware_shims, capsys):
+    from profiler import Profiler
+
+    profiler = Profiler(['read'])
+    run_loops(profiler, 5, 0.02)
+    profiler.report()
+    run_loops(profiler, 5, 0)
+
+    _, p95 = profiler.percentiles(0)
+    assert profiler.count[0] == 5
+    assert p95 <= profiler.max_us[0] < 20000
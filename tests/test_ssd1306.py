@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+# Arguments taken by the SSD1306 commands the driver sends
+COMMAND_ARGS = {0x20: 1, 0x21: 2, 0x22: 2, 0x81: 1, 0x8D: 1, 0xA8: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1}
+
+
+@pytest.fixture(scope='module')
+def SSD1306_I2C(firmware_shims):
+    from ssd1306 import SSD1306_I2C
+    return SSD1306_I2C
+
+
+@pytest.fixture(scope='module')
+def Controller(firmware_shims):
+    from machine import I2C
+
+    class Controller(I2C):
+        """An I2C bus with an SSD1306 on it, in horizontal addressing mode"""
+
+        def __init__(self):
+            super().__init__(0)
+            self.ram = bytearray(128 * 8)
+            self.command = []
+            self.col0, self.col1, self.page0, self.page1 = 0, 127, 0, 7
+            self.col = self.page = 0
+
+        def writeto(self, addr, buf, stop=True):
+            buf = bytes(buf)
+            control, payload = buf[0], buf[1:]
+            if control == 0x80:
+                self._commands(payload[:1])
+            elif control == 0x00:
+                self._commands(payload)
+            elif control == 0x40:
+                for byte in payload:
+                    self._data(byte)
+            else:
+                raise ValueError(f"unexpected control byte {control:#x}")
+            return super().writeto(addr, buf)
+
+        def writevto(self, addr, vector, stop=True):
+            return self.writeto(addr, b''.join(bytes(buf) for buf in vector))
+
+        def _commands(self, payload):
+            for byte in payload:
+                self.command.append(byte)
+                if len(self.command) <= COMMAND_ARGS.get(self.command[0], 0):
+                    continue
+                command, self.command = self.command, []
+                if command[0] == 0x21:
+                    self.col = self.col0 = command[1]
+                    self.col1 = command[2]
+                elif command[0] == 0x22:
+                    self.page = self.page0 = command[1]
+                    self.page1 = command[2]
+
+        def _data(self, byte):
+            self.ram[self.page * 128 + self.col] = byte
+            if self.col < self.col1:
+                self.col += 1
+            else:
+                self.col = self.col0
+                self.page = self.page0 if self.page == self.page1 else self.page + 1
+
+        def screen(self, width, pages, x0):
+            return bytes(b for page in range(pages) for b in self.ram[page * 128 + x0:page * 128 + x0 + width])
+
+    return Controller
+
+
+@pytest.mark.parametrize('width, height', [(128, 32), (128, 64), (64, 32)])
+def test_partial_show_keeps_the_display_in_sync(SSD1306_I2C, Controller, width, height):
+    bus = Controller()
+    display = SSD1306_I2C(width, height, bus)
+    # 64 pixel wide displays use columns 32-95 of the controller
+    x0 = 32 if width == 64 else 0
+    rng = random.Random(1)
+    for i in range(300):
+        op = rng.random()
+        if op < 0.4:
+            display.text("LRV: %.1f%%" % (rng.random() * 100), 0, rng.randrange(height), rng.randrange(2))
+        elif op < 0.6:
+            display.pixel(rng.randrange(width), rng.randrange(height), rng.randrange(2))
+        elif op < 0.8:
+            display.fill_rect(rng.randrange(width), rng.randrange(height), rng.randrange(20), rng.randrange(20),
+                              rng.randrange(2))
+        elif op < 0.82:
+            display.fill(0)
+        display.show(full=(i % 97 == 0))
+        assert bus.screen(width, height // 8, x0) == bytes(display.buffer), i
+
+
+def test_unchanged_frame_sends_nothing(SSD1306_I2C, Controller):
+    bus = Controller()
+    display = SSD1306_I2C(128, 32, bus)
+    display.text("#40e0d0", 0, 0)
+    display.show()
+    bus.reset()
+    display.show()
+    assert bus.transactions == 0
+    display.text("5", 80, 24)
+    display.show()
+    # One column window and the eight changed columns of one page
+    assert bus.transactions == 2
+    assert bus.bytes_written == 7 + 9
@@ -1,17 +1,51 @@
-from flask import Flask, render_template_string
+from flask import Flask, Response, g, request, render_template_string
 import threading
 import json
+import time
+from collections import namedtuple
+from pipeline import LatestValue
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 
 app = Flask(__name__)
 
-# Shared data storage
-current_data = {
+# Seconds between SSE comments sent to idle /stream clients to keep the connection open
+HEARTBEAT_INTERVAL = 15.0
+
+# An immutable, already-serialized view of the latest reading. update_data()
+# swaps in a new one as a whole, so readers never see half of an update.
+Snapshot = namedtuple('Snapshot', ['seq', 'data', 'body', 'etag', 'event'])
+
+# Keeps ETags from one run from matching those of a previous run
+BOOT_ID = format(int(time.time()), 'x')
+
+def make_snapshot(seq, data):
+    body = json.dumps(dict(data, seq=seq)).encode()
+    return Snapshot(
+        seq=seq,
+        data=data,
+        body=body,
+        etag=f"{BOOT_ID}-{seq}",
+        event=b"id: %d\ndata: %s\n\n" % (seq, body)
+    )
+
+snapshot = make_snapshot(0, {
     'color_hex': '#000000',
     'color_name': 'Unknown',
     'lrv': 0,
     'rgb': {'r': 0, 'g': 0, 'b': 0},
     'raw': {'r': 0, 'g': 0, 'b': 0, 'c': 0}
-}
+})
+publish_lock = threading.Lock()
+
+# HistoryStore behind /history, set with set_history() when recording is enabled
+history = None
+
+# metrics.Registry behind /metrics, set with set_metrics() when metrics are enabled
+metrics = None
+
+# Default /history window (seconds) and number of points
+HISTORY_WINDOW = 3600.0
+HISTORY_MAX_POINTS = 1000
 
 # HTML template with embedded CSS and JavaScript
 HTML_TEMPLATE = '''
@@ -107,62 +141,205 @@ HTML_TEMPLATE = '''
     </div>
 
     <script>
+        function render(data) {
+            // Update both color chips
+            document.getElementById('colorChip').style.backgroundColor = data.color_hex;
+            
+            // Calculate raw color hex from raw RGB values
+            const rawMax = Math.max(data.raw.r, data.raw.g, data.raw.b);
+            const scale = rawMax > 0 ? 255 / rawMax : 1;
+            const rawHex = '#' + 
+                Math.round(data.raw.r * scale).toString(16).padStart(2, '0') +
+                Math.round(data.raw.g * scale).toString(16).padStart(2, '0') +
+                Math.round(data.raw.b * scale).toString(16).padStart(2, '0');
+            document.getElementById('rawColorChip').style.backgroundColor = rawHex;
+            
+            document.getElementById('colorHex').textContent = data.color_hex;
+            document.getElementById('colorName').textContent = data.color_name;
+            document.getElementById('lrvValue').textContent = data.lrv.toFixed(1);
+            
+            document.getElementById('rgbR').textContent = data.rgb.r;
+            document.getElementById('rgbG').textContent = data.rgb.g;
+            document.getElementById('rgbB').textContent = data.rgb.b;
+            
+            document.getElementById('rawR').textContent = data.raw.r;
+            document.getElementById('rawG').textContent = data.raw.g;
+            document.getElementById('rawB').textContent = data.raw.b;
+            document.getElementById('rawC').textContent = data.raw.c;
+        }
+
         function updateData() {
             fetch('/data')
                 .then(response => response.json())
-                .then(data => {
-                    // Update both color chips
-                    document.getElementById('colorChip').style.backgroundColor = data.color_hex;
-                    
-                    // Calculate raw color hex from raw RGB values
-                    const rawMax = Math.max(data.raw.r, data.raw.g, data.raw.b);
-                    const scale = rawMax > 0 ? 255 / rawMax : 1;
-                    const rawHex = '#' + 
-                        Math.round(data.raw.r * scale).toString(16).padStart(2, '0') +
-                        Math.round(data.raw.g * scale).toString(16).padStart(2, '0') +
-                        Math.round(data.raw.b * scale).toString(16).padStart(2, '0');
-                    document.getElementById('rawColorChip').style.backgroundColor = rawHex;
-                    
-                    document.getElementById('colorHex').textContent = data.color_hex;
-                    document.getElementById('colorName').textContent = data.color_name;
-                    document.getElementById('lrvValue').textContent = data.lrv.toFixed(1);
-                    
-                    document.getElementById('rgbR').textContent = data.rgb.r;
-                    document.getElementById('rgbG').textContent = data.rgb.g;
-                    document.getElementById('rgbB').textContent = data.rgb.b;
-                    
-                    document.getElementById('rawR').textContent = data.raw.r;
-                    document.getElementById('rawG').textContent = data.raw.g;
-                    document.getElementById('rawB').textContent = data.raw.b;
-                    document.getElementById('rawC').textContent = data.raw.c;
-                });
+                .then(render);
+        }
+
+        // Poll every second while the live stream is unavailable
+        let pollTimer = null;
+        function startPolling() {
+            if (pollTimer === null) {
+                pollTimer = setInterval(updateData, 1000);
+                updateData();
+            }
+        }
+        function stopPolling() {
+            if (pollTimer !== null) {
+                clearInterval(pollTimer);
+                pollTimer = null;
+            }
         }
 
-        // Update every second
-        setInterval(updateData, 1000);
-        updateData();  // Initial update
+        if (window.EventSource) {
+            // Readings are pushed as soon as they are published
+            const source = new EventSource('/stream');
+            source.onmessage = event => render(JSON.parse(event.data));
+            source.onopen = stopPolling;
+            source.onerror = startPolling;  // EventSource keeps reconnecting meanwhile
+        } else {
+            startPolling();
+        }
     </script>
 </body>
 </html>
 '''
 
+@app.before_request
+def start_request_timer():
+    if metrics is not None:
+        g.request_start = time.perf_counter()
+
+@app.after_request
+def observe_request_time(response):
+    # Streaming responses are timed up to the start of the stream
+    if metrics is not None and 'request_start' in g:
+        path = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.histogram('lrv_http_request_seconds', 'Time spent handling web interface requests',
+                          {'path': path}).observe(time.perf_counter() - g.request_start)
+    return response
+
 @app.route('/')
 def index():
     return render_template_string(HTML_TEMPLATE)
 
+class Broadcaster:
+    """
+    Push serialized updates to every /stream client.
+
+    Each client has its own one-slot queue: an update replaces one the
+    client hasn't sent yet, so a slow client skips stale readings
+    instead of stalling the publisher or the other clients.
+    """
+
+    def __init__(self):
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        queue = LatestValue()
+        with self._lock:
+            self._clients.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        with self._lock:
+            self._clients.discard(queue)
+
+    @property
+    def clients(self):
+        return len(self._clients)
+
+    def publish(self, message):
+        with self._lock:
+            clients = list(self._clients)
+        for queue in clients:
+            queue.put(message)
+
+broadcaster = Broadcaster()
+
 @app.route('/data')
 def get_data():
-    return json.dumps(current_data)
+    current = snapshot
+    if request.if_none_match.contains(current.etag):
+        response = Response(status=304)
+    else:
+        response = Response(current.body, mimetype='application/json')
+    response.set_etag(current.etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/history')
+def get_history():
+    if history is None:
+        return Response(json.dumps({'error': 'History recording is disabled'}),
+                        status=404, mimetype='application/json')
+    # Times are unix seconds; missing or malformed values fall back to the defaults
+    end = request.args.get('to', type=float)
+    if end is None:
+        end = time.time()
+    start = request.args.get('from', type=float)
+    if start is None:
+        start = end - HISTORY_WINDOW
+    max_points = request.args.get('max_points', type=int, default=HISTORY_MAX_POINTS)
+    count, records = history.query(start, end, max(2, max_points))
+    return Response(json.dumps({
+        'from': start,
+        'to': end,
+        'count': count,
+        'points': [
+            {'t': t, 'lrv': round(lrv, 1), 'raw': {'r': r, 'g': g, 'b': b, 'c': c}}
+            for t, r, g, b, c, lrv in records
+        ]
+    }), mimetype='application/json')
+
+@app.route('/metrics')
+def get_metrics():
+    if metrics is None:
+        return Response('Metrics are disabled\n', status=404, mimetype='text/plain')
+    return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/stream')
+def stream():
+    def events():
+        queue = broadcaster.subscribe()
+        try:
+            yield snapshot.event
+            while True:
+                message = queue.get(timeout=HEARTBEAT_INTERVAL)
+                yield message if message is not None else b": heartbeat\n\n"
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 def update_data(hex_color, color_name, lrv, rgb_values, raw_values):
-    current_data['color_hex'] = hex_color
-    current_data['color_name'] = color_name if color_name else 'Unknown'
-    current_data['lrv'] = lrv
-    current_data['rgb'] = rgb_values
-    current_data['raw'] = raw_values
+    global snapshot
+    data = {
+        'color_hex': hex_color,
+        'color_name': color_name if color_name else 'Unknown',
+        'lrv': lrv,
+        'rgb': rgb_values,
+        'raw': raw_values
+    }
+    with publish_lock:
+        published = make_snapshot(snapshot.seq + 1, data)
+        snapshot = published
+    broadcaster.publish(published.event)
+
+def set_history(store):
+    global history
+    history = store
+
+def set_metrics(registry):
+    global metrics
+    metrics = registry
+    if registry is not None:
+        registry.gauge_func('lrv_stream_clients', 'Connected /stream clients',
+                            lambda: broadcaster.clients)
 
 def start_server():
-    app.run(host='0.0.0.0', port=8080)
+    # Threaded so every /stream client has its own connection thread
+    app.run(host='0.0.0.0', port=8080, threaded=True)
 
 if __name__ == '__main__':
     start_server() 
\ No newline at end of file